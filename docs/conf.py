@@ -45,6 +45,12 @@ extensions = [
     # 'sphinxcontrib.exceltable',  # show xls exceltables
 ]
 
+# Skip rendering the highlighted module sources when iterating locally on
+# the docs (TESSIF_FAST_DOCS=1). The autosummary tables are kept, since the
+# module docstrings rely on them.
+if os.environ.get("TESSIF_FAST_DOCS"):
+    extensions.remove("sphinx.ext.viewcode")
+
 html_theme = "sphinx_rtd_theme"
 html_theme_options = {
     "canonical_url": "https://github.com/tZ3ma/tessif/",
@@ -53,15 +59,27 @@ html_theme_options = {
 }
 
 # Example configuration for intersphinx: refer to the Python standard library.
+# Inventories stored in docs/_inv/ (see "nox -s docs_refresh_inv") are used
+# first, the remote ones are only fetched if there is no local copy.
 intersphinx_mapping = {
-    "python": ("https://docs.python.org/3/", None),
-    "networkx": ("https://networkx.org/documentation/stable/", None),
-    "pandas": ("https://pandas.pydata.org/pandas-docs/stable/", None),
-    "numpy": ("https://numpy.org/doc/stable/", None),
-    "scipy": ("https://docs.scipy.org/doc/scipy/reference", None),
-    "matplotlib": ("https://matplotlib.org", None),
+    "python": ("https://docs.python.org/3/", ("_inv/python.inv", None)),
+    "networkx": (
+        "https://networkx.org/documentation/stable/",
+        ("_inv/networkx.inv", None),
+    ),
+    "pandas": ("https://pandas.pydata.org/docs/", ("_inv/pandas.inv", None)),
+    "numpy": ("https://numpy.org/doc/stable/", ("_inv/numpy.inv", None)),
+    "scipy": ("https://docs.scipy.org/doc/scipy/", ("_inv/scipy.inv", None)),
+    "matplotlib": (
+        "https://matplotlib.org/stable/",
+        ("_inv/matplotlib.inv", None),
+    ),
 }
 
+# Inventories are fetched concurrently by sphinx, so a single unresponsive
+# host would stall the build. Give up on it after a few seconds instead.
+intersphinx_timeout = 5
+
 # Sort the documentation
 autodoc_member_order = "bysource"
 
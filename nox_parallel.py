@@ -0,0 +1,65 @@
+# nox_parallel.py
+"""Run read-only nox sessions in parallel.
+
+Only sessions that neither rewrite the working tree nor share build
+directories are run concurrently. Formatting (``pre-commit``, ``black``) and
+docs sessions have to be run on their own, using plain ``nox``.
+
+Usage::
+
+    python nox_parallel.py                  # all parallel safe sessions
+    python nox_parallel.py tests xdoctest   # selected sessions only
+"""
+
+# standard library
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# sessions only reading the working tree, each using its own venv
+parallel_safe_sessions = ("lint", "pylint", "safety", "tests", "xdoctest")
+
+# leave some cores to the os and to the sessions' own subprocesses
+max_workers = max(1, (os.cpu_count() or 1) - 2)
+
+
+def run_session(name):
+    """Run a single nox session and return its exit code and output."""
+    process = subprocess.run(
+        ["nox", "--sessions", name],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    return process.returncode, process.stdout
+
+
+def main(sessions):
+    """Run sessions concurrently and report their grouped output."""
+    unsafe = [name for name in sessions if name not in parallel_safe_sessions]
+    if unsafe:
+        print(
+            f"nox > not running in parallel: {', '.join(unsafe)}\n"
+            f"nox > parallel safe sessions are: {', '.join(parallel_safe_sessions)}"
+        )
+        return 2
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = dict(zip(sessions, executor.map(run_session, sessions)))
+
+    failed = []
+    for name, (returncode, output) in results.items():
+        print(f"{20 * '='} nox > {name} {20 * '='}")
+        print(output)
+        if returncode:
+            failed.append(name)
+
+    for name in sessions:
+        print(f"nox > {name}: {'failed' if name in failed else 'success'}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:] or list(parallel_safe_sessions)))
@@ -2,8 +2,11 @@
 """Configure nox sessions."""
 
 # standard library
+import hashlib
+import os
+import runpy
 import shutil
-import tempfile
+import urllib.request
 from pathlib import Path
 
 # third pary packages
@@ -23,30 +26,93 @@ nox.options.sessions = (
     "docs_rebuild",
 )
 
+# reuse the session venvs, so installed packages (e.g. the many flake8
+# plugins of the lint session) are only reinstalled if they changed.
+# Use "nox --no-reuse-existing-virtualenvs" to force fresh environments.
+nox.options.reuse_existing_virtualenvs = True
+
 # locations to run linting and formatting on:
-locations = "src", "tests", "noxfile.py", "docs/conf.py"
+locations = "src", "tests", "noxfile.py", "nox_parallel.py", "docs/conf.py"
 
 
-@nox_poetry.session(python="3.10")
-def tests(session):
-    """Run test suite."""
-    args = session.posargs or [
-        "--cov",
+def run_install(session, marker_name, *args, **kwargs):
+    """Run an install command unless the dependency specs are unchanged.
+
+    After a successful install a hash of ``pyproject.toml`` and
+    ``poetry.lock`` is stored as ``marker_name`` inside the session venv.
+    As long as it matches, subsequent runs of reused venvs skip the install.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for spec in ("pyproject.toml", "poetry.lock"):
+        digest.update(Path(spec).read_bytes())
+
+    marker = Path(session.virtualenv.location, marker_name)
+    if marker.is_file() and marker.read_text() == digest.hexdigest():
+        session.log(f"Dependencies unchanged, skipping: {' '.join(args)}")
+        return
+
+    session.run(*args, **kwargs)
+    marker.write_text(digest.hexdigest())
+
+
+def install_editable(session):
+    """Install tessif in editable mode, pinned to the versions in poetry.lock.
+
+    Skips building and installing a fresh wheel on every session run.
+    """
+    requirements = session.poetry.export_requirements()
+    run_install(
+        session,
+        ".editable-install-hash",
+        "python",
         "-m",
-        "not e2e and not con and not slow",
-        # append exlcuded markers as "and not ..."
-    ]
-    session.run("poetry", "install", "--only", "main", external=True)
+        "pip",
+        "install",
+        f"--constraint={requirements}",
+        "--editable",
+        ".",
+    )
+
+
+def poetry_install(session):
+    """Install tessif and its main dependencies using poetry."""
+    run_install(
+        session,
+        ".poetry-install-hash",
+        "poetry",
+        "install",
+        "--no-dev",
+        external=True,
+    )
+
+
+def run_tests(session, *args):
+    """Install tessif and its test requirements and run pytest."""
+    install_editable(session)
     session.install(
         "tessif-examples",
         "coverage[toml]",
         "pytest",
         "pytest-cov",
         "pytest-mock",
+        "pytest-xdist",
     )
     session.run("pytest", *args)
 
 
+@nox_poetry.session(python="3.10")
+def tests(session):
+    """Run test suite."""
+    args = session.posargs or [
+        "-n",
+        "auto",
+        "-m",
+        "not e2e and not con and not slow",
+        # append exlcuded markers as "and not ..."
+    ]
+    run_tests(session, *args)
+
+
 @nox_poetry.session(python="3.10")
 def lint(session):
     """Lint using flake8."""
@@ -72,7 +138,7 @@ def lint(session):
 def pylint(session):
     """Lint using pylint."""
     args = session.posargs or locations
-    session.run("poetry", "install", "--no-dev", external=True)
+    install_editable(session)
     session.install(
         "pytest",
         "requests",
@@ -95,7 +161,7 @@ def black(session):
 def xdoctest(session):
     """Run examples with xdoctest."""
     args = session.posargs or ["all"]
-    session.run("poetry", "install", "--no-dev", external=True)
+    install_editable(session)
     session.install("xdoctest", "pygments")
     session.run("python", "-m", "xdoctest", "tessif", *args)
 
@@ -103,25 +169,33 @@ def xdoctest(session):
 @nox_poetry.session(python="3.10")
 def docs(session):
     """Build the documentation."""
-    session.run("poetry", "install", "--no-dev", external=True)
+    install_editable(session)
     session.install(
         "sphinx",
+        "PyStemmer",
         "sphinx-click",
         "furo",
         "sphinx-paramlinks",
         "sphinx-rtd-theme",
         "pytest",
     )
-    session.run("sphinx-build", "docs", "docs/_build")
+    session.run("sphinx-build", "-j", "auto", "docs", "docs/_build")
 
 
 @nox_poetry.session(python="3.10")
 def docs_live(session):
     """Build and serve the documentation with live reloading on changes."""
-    args = session.posargs or ["--open-browser", "docs", "docs/_build"]
-    session.run("poetry", "install", "--no-dev", external=True)
+    args = session.posargs or [
+        "--open-browser",
+        "-j",
+        "auto",
+        "docs",
+        "docs/_build",
+    ]
+    install_editable(session)
     session.install(
         "sphinx",
+        "PyStemmer",
         "sphinx-autobuild",
         "sphinx-click",
         "sphinx-paramlinks",
@@ -130,19 +204,22 @@ def docs_live(session):
         "tessif-examples",
     )
 
-    build_dir = Path("docs", "_build")
-    if build_dir.exists():
-        shutil.rmtree(build_dir)
+    # keep the previous build for incremental rebuilds, unless a clean one
+    # is requested explicitly via TESSIF_DOCS_CLEAN=1 nox -s docs_live
+    if os.environ.get("TESSIF_DOCS_CLEAN"):
+        shutil.rmtree(Path("docs", "_build"), ignore_errors=True)
 
+    session.env["TESSIF_FAST_DOCS"] = "1"
     session.run("sphinx-autobuild", *args)
 
 
 @nox_poetry.session(python="3.10")
 def docs_rebuild(session):
     """Rebuild the entire sphinx documentation."""
-    session.run("poetry", "install", "--no-dev", external=True)
+    install_editable(session)
     session.install(
         "sphinx",
+        "PyStemmer",
         "sphinx-click",
         "sphinx-paramlinks",
         "sphinx-rtd-theme",
@@ -153,20 +230,39 @@ def docs_rebuild(session):
     if build_dir.exists():
         shutil.rmtree(build_dir)
 
-    session.run("sphinx-build", "docs", "docs/_build")
+    session.run("sphinx-build", "-j", "auto", "docs", "docs/_build")
+
+
+@nox.session(python=False)
+def docs_refresh_inv(session):
+    """Download the intersphinx inventories used by the docs to docs/_inv."""
+    intersphinx_mapping = runpy.run_path("docs/conf.py")["intersphinx_mapping"]
+    for uri, (local_inventory, _) in intersphinx_mapping.values():
+        target = Path("docs", local_inventory)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        session.log(f"Downloading {uri}objects.inv to {target}")
+        urllib.request.urlretrieve(f"{uri}objects.inv", target)  # nosec
 
 
 @nox_poetry.session(python="3.10")
 def coverage(session):
-    """Produce coverage report."""
-    session.install("coverage[toml]", "codecov")
+    """Run test suite measuring coverage and produce coverage report."""
+    args = session.posargs or [
+        "--cov",
+        "-n",
+        "auto",
+        "-m",
+        "not e2e and not con and not slow",
+    ]
+    run_tests(session, *args)
     session.run("coverage", "xml", "--fail-under=0")
 
 
 @nox_poetry.session(python="3.10")
 def codecov(session):
     """Produce coverage report and try uploading to codecov."""
-    session.install("coverage[toml]", "codecov")
+    run_tests(session, "--cov", "-n", "auto", "-m", "not e2e and not con and not slow")
+    session.install("codecov")
     session.run("coverage", "xml", "--fail-under=0")
     session.run("codecov", *session.posargs)
 
@@ -175,7 +271,7 @@ def codecov(session):
 def precommit(session):
     """Lint using pre-commit."""
     args = session.posargs or ["run", "--all-files", "--show-diff-on-failure"]
-    session.run("poetry", "install", "--no-dev", external=True)
+    poetry_install(session)
     session.install(
         "darglint",
         "black",
@@ -202,15 +298,7 @@ def precommit(session):
 @nox_poetry.session(python="3.10")
 def safety(session):
     """Scan dependencies for insecure packages using safety."""
-    with tempfile.NamedTemporaryFile() as requirements:
-        session.run(
-            "poetry",
-            "export",
-            "--dev",
-            "--format=requirements.txt",
-            "--without-hashes",
-            f"--output={requirements.name}",
-            external=True,
-        )
-        session.install("safety")
-        session.run("safety", "check", f"--file={requirements.name}", "--full-report")
+    # exported once and reused as long as poetry.lock stays unchanged
+    requirements = session.poetry.export_requirements()
+    session.install("safety")
+    session.run("safety", "check", f"--file={requirements}", "--full-report")
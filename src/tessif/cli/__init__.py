@@ -0,0 +1,43 @@
+# src/tessif/cli/__init__.py
+"""Module providing the Tessif Command Line Interface (CLI).
+
+Each command lives in its own :mod:`tessif.cli.commands` module, which is
+only imported when the command is invoked or its help is shown.
+"""
+import functools
+import importlib
+
+import click
+
+
+@functools.lru_cache(maxsize=None)
+def _get_logger():
+    """Create the cli logger on first use, instead of on module import."""
+    from tessif.logging import create_logger
+
+    return create_logger(__name__)
+
+
+class LazyGroup(click.Group):
+    """Click group importing its commands only when they are needed."""
+
+    commands_package = "tessif.cli.commands"
+    lazy_commands = ("init", "integrate", "tropp")
+
+    def list_commands(self, ctx):
+        """List the available command names without importing them."""
+        return sorted(set(self.lazy_commands).union(super().list_commands(ctx)))
+
+    def get_command(self, ctx, cmd_name):
+        """Import and return the requested command."""
+        if cmd_name not in self.lazy_commands:
+            return super().get_command(ctx, cmd_name)
+
+        module = importlib.import_module(f"{self.commands_package}.{cmd_name}")
+        return module.cli
+
+
+@click.group(cls=LazyGroup)
+def main_cli_entry():
+    """Tessif-Command main entry point."""
+    pass
@@ -0,0 +1,6 @@
+# src/tessif/cli/commands/__init__.py
+"""Tessif's CLI commands, each one living in its own module.
+
+Modules are imported by :class:`tessif.cli.LazyGroup` only when their
+command is invoked.
+"""
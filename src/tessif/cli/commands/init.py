@@ -0,0 +1,50 @@
+# src/tessif/cli/commands/init.py
+"""Tessif's ``init`` command."""
+import os
+import sys
+from pathlib import Path
+
+import click
+
+from tessif.cli import _get_logger
+
+
+@click.command(name="init")
+@click.option(
+    "-d",
+    "--tessif-directory",
+    help="(Optional) Venv directory the plugin will be installed into.",
+    default="~/.tessif.d/",
+    show_default=True,
+)
+@click.option(
+    "--dry",
+    help="Execute integration with actually installing anything",
+    is_flag=True,
+)
+def cli(tessif_directory=None, dry=False):
+    """Initialize tessif's working directory."""
+    from tessif.frused.paths import tessif_dir
+
+    logger = _get_logger()
+
+    if not tessif_directory:
+        tessif_directory = tessif_dir
+    elif tessif_directory == "~/.tessif.d/":
+        tessif_directory = tessif_dir
+
+    # Create a Path object for the new folder
+    working_directory = Path(tessif_directory)
+    logging_directory = Path(os.path.join(tessif_directory, "logs"))
+
+    if not dry:
+        # Create the folder if it doesn't exist, with parents as needed
+        working_directory.mkdir(parents=True, exist_ok=True)
+        logging_directory.mkdir(parents=True, exist_ok=True)
+
+        logger.info(
+            "Succesfully initialized tessif's working directory at %s",
+            working_directory,
+        )
+
+    return sys.exit(os.EX_OK)
@@ -0,0 +1,153 @@
+# src/tessif/cli/commands/integrate.py
+"""Tessif's ``integrate`` command."""
+import os
+import sys
+
+import click
+
+from tessif.cli import _get_logger
+
+
+def _integrate_plugin(plugin, venv_dir, dry=False):
+    """Create the plugin's venv and pip install the plugin into it."""
+    import shutil
+    import subprocess
+    import venv
+
+    logger = _get_logger()
+
+    logger.info("Establish plugin venv directory at\n%s", venv_dir)
+
+    python_bin = os.path.join(venv_dir, "bin", "python")
+    logger.info("Initializing new python binary at %s", python_bin)
+
+    # prefer uv if available, its installs are a lot faster than pip's
+    uv_bin = shutil.which("uv")
+    if uv_bin:
+        install_command = [uv_bin, "pip", "install", "--python", python_bin]
+    else:
+        install_command = [
+            python_bin,
+            "-m",
+            "pip",
+            "install",
+            "--disable-pip-version-check",
+        ]
+
+    if not dry:
+        # always seed pip, so the venv stays usable without uv, and symlink
+        # the interpreter instead of copying it where possible
+        venv.create(venv_dir, with_pip=True, symlinks=os.name != "nt")
+
+    logger.info(
+        "Succesfully created venv for plugin %s at %s",
+        plugin,
+        venv_dir,
+    )
+
+    logger.info(
+        "Attempting to integrate plugin %s to %s using %s",
+        plugin,
+        venv_dir,
+        python_bin,
+    )
+
+    if not dry:
+        subprocess.run(
+            [
+                *install_command,
+                "-U",  # update plugin
+                plugin,
+            ],
+            # the installer reads no input, and keeping the fds open spares
+            # popen its scan over all possible file descriptors
+            stdin=subprocess.DEVNULL,
+            close_fds=False,
+            check=True,
+        )
+    else:
+        logger.info("Performing a dry pip run:\n")
+        subprocess.run(
+            [
+                *install_command,
+                "--dry-run",  # perfrom dry run
+                plugin,
+            ],
+            stdin=subprocess.DEVNULL,
+            close_fds=False,
+            check=True,
+        )
+
+    logger.info(
+        "Succesfully added plugin %s to %s using %s",
+        plugin,
+        venv_dir,
+        python_bin,
+    )
+
+
+@click.command(name="integrate")
+@click.argument("plugins", metavar="PLUGIN...", nargs=-1, required=True)
+@click.option(
+    "-vd",
+    "--venv_dir",
+    help="(Optional) Venv directory the plugin will be installed into.",
+    default=None,
+    show_default=True,
+)
+@click.option(
+    "--dry",
+    help="Execute integration with actually installing anything",
+    is_flag=True,
+)
+def cli(plugins, venv_dir=None, dry=False):
+    """Integrate ESSMOS-Plugins.
+
+    Each plugin gets its own venv. Multiple plugins are integrated
+    concurrently.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from tessif.frused.defaults import registered_plugins, resolve_plugin
+    from tessif.frused.paths import tessif_dir
+
+    # Sanitize Plugin Input
+    sanitized_plugins = []
+    for plugin in plugins:
+        registered_plugin = resolve_plugin(plugin)
+        if registered_plugin is None:
+            msg = " ".join(
+                [
+                    f"Plugin {plugin} not recognized.",
+                    "Available plugins are:",
+                    *registered_plugins,
+                ]
+            )
+            raise click.BadParameter(msg, param_hint="PLUGIN...")
+        if registered_plugin not in sanitized_plugins:
+            sanitized_plugins.append(registered_plugin)
+
+    if venv_dir and len(sanitized_plugins) > 1:
+        raise click.BadParameter(
+            "A venv directory can only be supplied for a single plugin.",
+            param_hint="'--venv_dir'",
+        )
+
+    venv_dirs = [
+        venv_dir or os.path.join(tessif_dir, "plugin-venvs", plugin)
+        for plugin in sanitized_plugins
+    ]
+
+    # the work happens in venv and pip subprocesses, so threads suffice
+    with ThreadPoolExecutor(max_workers=len(sanitized_plugins)) as executor:
+        # consume the results to reraise failed integrations
+        list(
+            executor.map(
+                _integrate_plugin,
+                sanitized_plugins,
+                venv_dirs,
+                [dry] * len(sanitized_plugins),
+            )
+        )
+
+    return sys.exit(os.EX_OK)
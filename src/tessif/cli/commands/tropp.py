@@ -0,0 +1,251 @@
+# src/tessif/cli/commands/tropp.py
+"""Tessif's ``tropp`` command."""
+import json
+import logging
+import os
+from pathlib import Path
+
+import click
+
+from tessif.cli import _get_logger
+
+
+def _default_tropp_directory():
+    """Resolve the default tropp directory only when tropp is invoked."""
+    from tessif.frused.paths import tessif_dir
+
+    return os.path.join(tessif_dir, "tropp")
+
+
+def _system_model_cache_key(location):
+    """Identify the system model source and the software unpickling it."""
+    import pandas as pd
+
+    from tessif import __version__
+
+    stat = os.stat(location)
+    return (stat.st_mtime_ns, stat.st_size, __version__, pd.__version__)
+
+
+def _read_cached_system_model(cache_location, key):
+    """Return the cached system model, or None if it can not be reused.
+
+    Only cache files owned by the current user are trusted. Stale, corrupt
+    or otherwise unreadable caches are ignored.
+    """
+    import pickle  # nosec
+
+    try:
+        cache_stat = os.stat(cache_location)
+    except FileNotFoundError:
+        return None
+
+    if hasattr(os, "getuid") and cache_stat.st_uid != os.getuid():
+        return None
+
+    try:
+        with open(cache_location, "rb") as f:
+            if pickle.load(f) != key:  # nosec
+                return None
+            return pickle.load(f)  # nosec
+    except (
+        pickle.UnpicklingError,
+        EOFError,
+        AttributeError,
+        ImportError,
+        IndexError,
+        TypeError,
+        ValueError,
+    ):
+        return None
+
+
+def _write_cached_system_model(cache_location, key, system_model):
+    """Pickle the system model atomically into cache_location.
+
+    The cache is optional, so failing to write it is logged and ignored.
+    """
+    import pickle  # nosec
+    import tempfile
+
+    if not os.access(cache_location.parent, os.W_OK):
+        return
+
+    temporary_location = None
+    try:
+        # write into a temporary file first, so a concurrent or aborted run
+        # never leaves a partially written cache behind
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=cache_location.parent, suffix=".tmp", delete=False
+        ) as f:
+            temporary_location = f.name
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(system_model, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temporary_location, cache_location)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as error:
+        if temporary_location is not None and os.path.exists(temporary_location):
+            os.remove(temporary_location)
+        _get_logger().warning(
+            "Could not cache the system model at %s: %s", cache_location, error
+        )
+
+
+def _is_temporary_directory(directory):
+    """Check if directory lies inside the temporary directory of the system.
+
+    :meth:`AbstractEnergySystem.tropp
+    <tessif.system_model.AbstractEnergySystem.tropp>` uses a new temporary
+    directory for each run, so a system model cached there is never reused.
+    """
+    import tempfile
+
+    temporary_root = Path(tempfile.gettempdir()).resolve()
+    return temporary_root in Path(directory).resolve().parents
+
+
+def _load_system_model(location, cache=True):
+    """Load the system model, reusing a cached deserialization if possible.
+
+    The deserialized system model is pickled next to its json source as
+    ``<location>.cache.pkl``, keyed by the source's modification time and
+    size as well as by the tessif and pandas versions. As long as those are
+    unchanged, the (much faster to load) pickle is used instead of
+    deserializing the json again. Caches that can not be read are replaced.
+    Nothing is cached if ``cache`` is False.
+    """
+    from tessif.system_model import AbstractEnergySystem
+
+    key = _system_model_cache_key(location)
+    cache_location = Path(f"{location}.cache.pkl")
+
+    system_model = _read_cached_system_model(cache_location, key)
+    if system_model is not None:
+        return system_model
+
+    with open(location, "rb") as f:
+        system_model = AbstractEnergySystem.deserialize(f.read())
+
+    if cache:
+        _write_cached_system_model(cache_location, key, system_model)
+
+    return system_model
+
+
+def _store_resultier(resultier, location):
+    """Write the json serialized resultier into location."""
+    from tessif.serialize import ResultierEncoder
+
+    # json.dumps uses the C encoder, while json.dump always falls back to
+    # the (several times slower) pure python one for its chunked writes
+    serialized_resultier = json.dumps(resultier.dct_repr(), cls=ResultierEncoder)
+
+    # stored as json string literal, the format tessif versions read
+    with open(location, "w") as f:
+        f.write(json.dumps(serialized_resultier))
+
+
+@click.command(name="tropp")
+@click.argument("plugin")
+@click.option(
+    "-d",
+    "--directory",
+    help="Directory the system_model.tsf and the results are/will be stored in",
+    default=_default_tropp_directory,
+    show_default="~/.tessif.d/tropp",
+)
+@click.option(
+    "-q",
+    "--quiet",
+    help="Silences the stdout info level logging",
+    is_flag=True,
+)
+@click.option(
+    "--trans_ops",
+    help="Dictionairy holding the transformation options",
+    default=None,
+    show_default=True,
+)
+@click.option(
+    "--opt_ops",
+    help="Dictionairy holding the optimization options (not yet implemented)",
+    default=None,
+    show_default=True,
+)
+def cli(plugin, directory, quiet, trans_ops, opt_ops):
+    """Transform Optimize and Post-Process."""
+    import tessif.tropp
+    from tessif.logging import reset_basic_config
+
+    logger = _get_logger()
+
+    # Parse the arguments
+
+    # logger.setLevel(logging.INFO)
+    if quiet:
+        logger.setLevel(logging.WARNING)
+
+    # Create the folder if it doesn't exist, with parents as needed
+    working_directory = Path(directory)
+    working_directory.mkdir(parents=True, exist_ok=True)
+
+    # initialize storage locations
+    system_model_location = working_directory / "tessif_system_model.tsf"
+    igr_resultier_location = working_directory / f"{plugin}_igr_resultier.igr"
+    all_resultier_location = working_directory / f"{plugin}_all_resutlier.alr"
+
+    # start tropp process
+    logger.info(
+        "%s\nTRansform Optimize and Post-Process!\nUsing Plugin: %s",
+        60 * "-",
+        plugin,
+    )
+
+    restored_sys_mod = _load_system_model(
+        system_model_location,
+        cache=not _is_temporary_directory(working_directory),
+    )
+
+    # restored_es = AbstractEnergySystem(uid="This Instance Is Restored")
+    # restored_es.unpickle(system_model_location)
+
+    # logger.info("On The System Model Stored In:")
+    # logger.info(system_model_location)
+    # logger.info("")
+
+    logger.info("Transform to %s System Model", plugin)
+    plugin_system_model = tessif.tropp.transform(
+        tessif_system_model=restored_sys_mod,
+        plugin=plugin,
+        trans_ops=trans_ops,
+    )
+    reset_basic_config()
+    logger.info("Transformation Succesfull!\n")
+
+    # lgers = logging.Logger.manager.loggerDict
+    # for lger, value in lgers.items():
+    #     print(lger, value)
+
+    logger.info("Optimize %s System Model", plugin)
+    optimized_plugin_system_model = tessif.tropp.optimize(
+        plugin_system_model=plugin_system_model,
+        plugin=plugin,
+        opt_ops=opt_ops,
+    )
+    logger.info("Optimization Succesful!\n")
+
+    logger.info("Post-Process %s System Model", plugin)
+    global_resultier, all_resultier = tessif.tropp.post_process(
+        optimized_plugin_system_model=optimized_plugin_system_model,
+        plugin=plugin,
+    )
+    # post_opt_logger.disable = True
+    # logger = create_logger(f"{__name__}.post_post_processing")
+    logger.info("Post-Processing Succesful!\n")
+
+    _store_resultier(global_resultier, igr_resultier_location)
+    logger.info("Stored global results to %s", igr_resultier_location)
+
+    _store_resultier(all_resultier, all_resultier_location)
+    logger.info("Stored all other results to %s", all_resultier_location)
+    logger.info(60 * "-" + "\n")
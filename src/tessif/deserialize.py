@@ -1,12 +1,34 @@
 """Restore / Deserialize previously serialized tessif features using json."""
 import json
 from ast import literal_eval
-from collections import defaultdict
+from io import StringIO
 
 import pandas as pd
 
 from tessif.frused.namedtuples import Edge, Uid
 
+# translation tables removing the stringified container characters
+_EDGE_STRIP = str.maketrans("", "", "[]() ")
+_KEY_STRIP = str.maketrans("", "", "[]()'")
+
+
+def _json_buffer(value):
+    """Wrap a json string, or json encode already parsed data, for read_json."""
+    return StringIO(value if isinstance(value, str) else json.dumps(value))
+
+
+def load_tropp_json(stream):
+    """Load json written by any tessif version into python objects.
+
+    Tessif used to encode the files exchanged with the plugin venvs twice,
+    storing the serialized json string as a json string literal. Both the
+    twice and the once encoded files are recognized.
+    """
+    loaded = json.loads(stream)
+    if isinstance(loaded, str):
+        loaded = json.loads(loaded)
+    return loaded
+
 
 class RestoredResults:
     """Json Deserialzed Resultiers."""
@@ -14,8 +36,9 @@ class RestoredResults:
     def __init__(self, json_stream):
         """Deserialze Resuliter serialized results."""
         for key, value in json_stream.items():
-            if key in sm_deserializer.keys():
-                setattr(self, key.lstrip("_"), sm_deserializer[key](value))
+            deserializer = sm_deserializer.get(key)
+            if deserializer is not None:
+                setattr(self, _attribute_names[key], deserializer(value))
 
     _recognized_system_results = [
         "nodes",
@@ -49,41 +72,53 @@ class RestoredResults:
         "expansion_costs",
     ]
 
+    # restored results are stored in slots instead of an instance dict;
+    # the in- and outbounds are computed on first access and cached, their
+    # node tuples are immutable so handing out shallow copies is sufficient
+    __slots__ = (
+        *(
+            attr_name
+            for attr_name in _recognized_system_results
+            + _recognized_node_results
+            + _recognized_edge_results
+            if attr_name not in ("inbounds", "outbounds")
+        ),
+        "_inbounds",
+        "_outbounds",
+    )
+
+    # sorted once, so the data properties below come out sorted by key
+    _sorted_system_results = tuple(sorted(_recognized_system_results))
+    _sorted_node_results = tuple(sorted(_recognized_node_results))
+    _sorted_edge_results = tuple(sorted(_recognized_edge_results))
+
     @property
     def node_data(self):
         """Return all recognized node keyed results."""
-        dct = {
+        return {
             attr_name: getattr(self, attr_name)
-            for attr_name in self._recognized_node_results
+            for attr_name in self._sorted_node_results
             if hasattr(self, attr_name)
         }
-        dct = dict(sorted(dct.items()))
-        return dct
 
     @property
     def edge_data(self):
         """Return all recognized edge keyed results."""
-        dct = {
+        return {
             attr_name: getattr(self, attr_name)
-            for attr_name in self._recognized_edge_results
+            for attr_name in self._sorted_edge_results
             if hasattr(self, attr_name)
         }
 
-        dct = dict(sorted(dct.items()))
-        return dct
-
     @property
     def system_wide_data(self):
         """Return all recognized system wide results."""
-        dct = {
+        return {
             attr_name: getattr(self, attr_name)
-            for attr_name in self._recognized_system_results
+            for attr_name in self._sorted_system_results
             if hasattr(self, attr_name)
         }
 
-        dct = dict(sorted(dct.items()))
-        return dct
-
     @property
     def inbounds(self):
         """Inbound node mapping.
@@ -98,19 +133,18 @@ class RestoredResults:
             inbounds['1'] == []
             inbounds['2'] == ['1', '3']
         """
-        _inbounds = defaultdict(list)
-        for node in self.nodes:
+        if not hasattr(self, "_inbounds"):
+            _inbounds = {}
             for edge in self.edges:
-                if node == edge.target:
-                    _inbounds[node].append(edge.source)
+                _inbounds.setdefault(edge.target, []).append(edge.source)
 
-        # sort by keys
-        _inbounds = dict(sorted(_inbounds.items()))
-        # sort by nodes and turn into tuple
-        for key in _inbounds.copy().keys():
-            _inbounds[key] = tuple(sorted(_inbounds[key]))
+            # sort by nodes and turn into tuple
+            self._inbounds = {
+                node: tuple(sorted(_inbounds.get(node, ())))
+                for node in sorted(self.nodes)
+            }
 
-        return dict(_inbounds)
+        return dict(self._inbounds)
 
     @property
     def outbounds(self):
@@ -127,19 +161,18 @@ class RestoredResults:
             outbounds['1'] == []
             outbounds['2'] == ['1', '3']
         """
-        _outbounds = defaultdict(list)
-        for node in self.nodes:
+        if not hasattr(self, "_outbounds"):
+            _outbounds = {}
             for edge in self.edges:
-                if node == edge.source:
-                    _outbounds[node].append(edge.target)
+                _outbounds.setdefault(edge.source, []).append(edge.target)
 
-        # sort by keys
-        _outbounds = dict(sorted(_outbounds.items()))
-        # sort by nodes and turn into tuple
-        for key in _outbounds.copy().keys():
-            _outbounds[key] = tuple(sorted(_outbounds[key]))
+            # sort by nodes and turn into tuple
+            self._outbounds = {
+                node: tuple(sorted(_outbounds.get(node, ())))
+                for node in sorted(self.nodes)
+            }
 
-        return dict(_outbounds)
+        return dict(self._outbounds)
 
 
 def deserialize_nodes(nodes):
@@ -151,7 +184,7 @@ def deserialize_uid_nodes(node_uid_dict):
     """Deserialize node uids."""
     nuids = {}
     for value in node_uid_dict.values():
-        node_uid = Uid(*value)
+        node_uid = Uid.from_row(value)
         nuids[node_uid.name] = node_uid
 
     nuids = dict(sorted(nuids.items()))
@@ -181,15 +214,15 @@ def deserialize_dicts_of_pdseries_results(result_dict):
     """Deserialize dicts of pandas series results."""
     results = {}
     for key, value in sorted(result_dict.items()):
-        results[key] = pd.read_json(value, orient="split", typ="series")
+        results[key] = pd.read_json(_json_buffer(value), orient="split", typ="series")
     return results
 
 
 def deserialize_dicts_of_dataframe_results(results_dict):
-    """Deserialize number of constraints results."""
+    """Deserialize dicts of pandas dataframe results."""
     results = {}
     for key, value in sorted(results_dict.items()):
-        results[key] = pd.read_json(value, orient="split", typ="frame")
+        results[key] = pd.read_json(_json_buffer(value), orient="split", typ="frame")
     return results
 
 
@@ -197,15 +230,9 @@ def deserialize_edge_keyed_results(results_dict):
     """Deserialize net energy flow results."""
     edge_keyed_results = {}
 
-    # remove stringified container strings
-    remove_chars = "[]() "
-
-    # create a translation table that maps each character to None
-    translation_table = str.maketrans("", "", remove_chars)
-
     for key, value in sorted(results_dict.items()):
         # remove the container string characters using the translation table
-        destringified_edge = key.translate(translation_table)
+        destringified_edge = key.translate(_EDGE_STRIP)
 
         # split the edge string in source and target and create the edge
         edge = Edge(*destringified_edge.split(","))
@@ -238,6 +265,9 @@ sm_deserializer = {
     "_expansion_costs": deserialize_pure_dict_results,
 }
 
+# attribute names the sm_deserializer results are stored as
+_attribute_names = {key: key.lstrip("_") for key in sm_deserializer}
+
 
 class SystemModelDecoder(json.JSONDecoder):
     """Decoder used in tessif system model deserialization."""
@@ -247,10 +277,10 @@ class SystemModelDecoder(json.JSONDecoder):
 
     def parse_tuple(self, tpl):
         """Parse Tessif's various tuple stirngs."""
-        if "inf" in tpl:
-            tpl = tpl.replace("inf", "'inf'")
+        if "inf" not in tpl:
+            return literal_eval(tpl)
 
-        tpl = literal_eval(tpl)
+        tpl = literal_eval(tpl.replace("inf", "'inf'"))
 
         if "inf" in tpl:
             lst = [float("inf") if item == "inf" else item for item in tpl]
@@ -260,14 +290,8 @@ class SystemModelDecoder(json.JSONDecoder):
 
     def parse_edge_key(self, edge_string):
         """Parse the edge string key."""
-        # remove stringified container strings
-        remove_chars = "[]()'"
-
-        # create a translation table that maps each character to None
-        translation_table = str.maketrans("", "", remove_chars)
-
         # remove the container string characters using the translation table
-        destringified_edge = edge_string.translate(translation_table)
+        destringified_edge = edge_string.translate(_KEY_STRIP)
 
         # split the edge string in source and target and create the edge
         edge = Edge(*(item.strip() for item in destringified_edge.split(",")))
@@ -276,18 +300,16 @@ class SystemModelDecoder(json.JSONDecoder):
 
     def tuple_hook(self, d):
         """Modify tuple decoding."""
-        for key, value in d.copy().items():
-            if isinstance(value, str):
-                # check if value represents a tuple or list
-                if value.startswith("(") and value.endswith(")"):
-                    # parse tuple string
-                    value = self.parse_tuple(value)
-
-            if isinstance(key, str):
-                if key.startswith("(") and key.endswith(")"):
-                    # parse tuple string
-                    d.pop(key)
-                    key = self.parse_edge_key(key)
-
-            d[key] = value
-        return d
+        decoded = {}
+        for key, value in d.items():
+            # check if value represents a tuple or list
+            if isinstance(value, str) and value[:1] == "(" and value[-1:] == ")":
+                # parse tuple string
+                value = self.parse_tuple(value)
+
+            if isinstance(key, str) and key[:1] == "(" and key[-1:] == ")":
+                # parse tuple string
+                key = self.parse_edge_key(key)
+
+            decoded[key] = value
+        return decoded
@@ -157,7 +157,7 @@ Currently set to::
         info
 """
 
-maximum_logging_file_size = 1 * 1024 * 2014
+maximum_logging_file_size = 1 * 1024 * 1024
 """Maximum logging file size in bytes.
 
 Currently set to::
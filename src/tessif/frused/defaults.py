@@ -4,26 +4,55 @@
 :mod:`~tessif.frused.defaults` is a :mod:`tessif` subpackage providing
 frequently needed defaults. Everything loosely associated with fallback
 values as well as filter and sorting templates is aggregated here.
+
+The default templates are read-only :class:`~types.MappingProxyType` objects,
+shared by all of their users. Create a :class:`dict` from them to adjust
+values.
+
+The defaults relying on :mod:`matplotlib` or :mod:`tessif.frused.spellings`
+are only created on their first access, so importing this module does not
+import either of them:
+
+nxgrph_visualize_defaults
+    :mod:`~tessif.visualize.nxgrph` drawing defaults.
+
+    .. csv-table::
+        :file: docs/source/csvs/defaults/nxgrph_visualize_defaults.csv
+
+registered_essmos
+    Registered Energy Supply System Modelling and Optimization Software
+    (ESSMOS) and the sorted :class:`tuple` of their recognized spelling
+    variations. See :ref:`SupportedESSMOS`.
+
+essmos_by_spelling
+    Reverse index of ``registered_essmos``. Maps each (lower cased)
+    recognized spelling variation to its ESSMOS key, so resolving a user
+    supplied ESSMOS name is a single lookup::
+
+        from tessif.frused.defaults import essmos_by_spelling
+        print(essmos_by_spelling.get("pypsa"))
+        ppsa
 """
-from matplotlib import pyplot as plt
+import math
+import re
+import sys
+from types import MappingProxyType
 
 import tessif.frused.namedtuples as nts
-from tessif.frused.spellings import calliope as calliope_spellings
-from tessif.frused.spellings import fine as fine_spellings
-from tessif.frused.spellings import oemof as oemof_spellings
-from tessif.frused.spellings import pypsa as pypsa_spellings
-
-nxgrph_node_shapes = {
-    "bus": "o",
-    "connector": "o",
-    "commodity_source": "o",
-    "default_source": "o",
-    "sink": "8",
-    "solar": "s",
-    "storage": "s",
-    "transformer": "8",
-    "wind": "h",
-}
+
+nxgrph_node_shapes = MappingProxyType(
+    {
+        "bus": "o",
+        "connector": "o",
+        "commodity_source": "o",
+        "default_source": "o",
+        "sink": "8",
+        "solar": "s",
+        "storage": "s",
+        "transformer": "8",
+        "wind": "h",
+    }
+)
 """
 :mod:`~tessif.visualize.nxgrph` node shape visualization defaults.
 
@@ -31,91 +60,77 @@ nxgrph_node_shapes = {
     :file: docs/source/csvs/defaults/node_shapes.csv
 """
 
-dcgrph_node_shapes = {
-    "default_source": "round-rectangle",
-    "commodity_source": "round-rectangle",
-    "solar": "round-diamond",
-    "wind": "diamond",
-    "bus": "ellipse",
-    "transformer": "round-octagon",
-    "connector": "rectangle",
-    "sink": "ellipse",
-    "storage": "round-hexagon",
-}
+dcgrph_node_shapes = MappingProxyType(
+    {
+        "default_source": "round-rectangle",
+        "commodity_source": "round-rectangle",
+        "solar": "round-diamond",
+        "wind": "diamond",
+        "bus": "ellipse",
+        "transformer": "round-octagon",
+        "connector": "rectangle",
+        "sink": "ellipse",
+        "storage": "round-hexagon",
+    }
+)
 """:mod:`~tessif.visualize.dcgrph` node shape visualization defaults."""
 
-nxgrph_visualize_defaults = {
-    # node_defaults:
-    "node_labels": None,
-    "node_shape": "o",
-    "node_size": 3000,
-    "node_minimum_size": 0.1 * 3000,
-    "node_variable_size_scaling": 0.5,
-    "node_fill_size": 3000,
-    "node_color": "#AFAFAF",
-    "node_color_map": ["#AFAFAF"],
-    "node_alpha": 1.0,
-    "node_font_size": 11,
-    "node_font_weight": "light",
-    # edge defaults:
-    "edge_labels": None,
-    "edge_width": 1,
-    "edge_color": "black",
-    "edge_arrowstyle": "simple",
-    "edge_arrowsize": 7,
-    "edge_vmin": 0.0,
-    "edge_vmax": 1.0,
-    "edge_cmap": plt.cm.Greys,
-    "edge_len": 1.0,
-    "edge_minimum_grey": 0.15,
-    "edge_minimum_weight": 0.1,
-    "edge_minimum_width": 0.1,
-    # legend defaults:
-    "legend_labelspacing": 1,
-    "legend_title": None,
-    "legend_bbox_to_anchor": (1.0, 1),
-    "legend_loc": "best",
-    "legend_borderaxespad": 0,
-}
-"""
-:mod:`~tessif.visualize.nxgrph` drawing defaults.
 
-.. csv-table::
-    :file: docs/source/csvs/defaults/nxgrph_visualize_defaults.csv
-"""
-
-dcgrph_visualize_defaults = {
-    # node_defaults:
-    "node_labels": None,
-    "node_label_position": "center",
-    "node_shape": "ellipse",
-    "node_size": 90,
-    # 'node_size_basic': 100,
-    "node_color": "#AFAFAF",
-    "node_font_size": 15,
-    "node_minimum_size": 1,
-    "node_variable_size": 40,
-    "node_border_width": 0,
-    "node_fill_border_width": 1.5,  # used when partially filling a node
-    "node_border_style": None,  # 'solid',
-    "node_border_color": "black",
-    "node_font_weight": 550,
-    # edge defaults:
-    "edge_labels": None,
-    "edge_width": 7,
-    "edge_width_basic": 1,
-    "edge_color": "black",
-    "edge_arrow_color": "black",
-    "edge_arrowsize": 1,
-    "edge_arrowstyle": "triangle",
-    "edge_style": "bezier",
-    "edge_linestyle": "solid",
-    # replacing dotted by larger spaced dashes
-    "edge_dot_repl_pattern": [6, 6],
-    "edge_minimum_width": 0.5,
-    "edge_minimum_grey": 0.15,
-    "edge_minimum_weight": nxgrph_visualize_defaults["edge_minimum_weight"],
-}
+def _index_by_shape(node_shapes):
+    """Map each node shape to the node types drawn with it."""
+    nodes_by_shape = {}
+    for node_type, shape in node_shapes.items():
+        nodes_by_shape.setdefault(shape, []).append(node_type)
+    return MappingProxyType(
+        {shape: tuple(node_types) for shape, node_types in nodes_by_shape.items()}
+    )
+
+
+nxgrph_nodes_by_shape = _index_by_shape(nxgrph_node_shapes)
+"""Reverse index of :attr:`nxgrph_node_shapes`, mapping shapes to node types."""
+
+dcgrph_nodes_by_shape = _index_by_shape(dcgrph_node_shapes)
+"""Reverse index of :attr:`dcgrph_node_shapes`, mapping shapes to node types."""
+
+# drawing defaults shared by the nxgrph and dcgrph defaults
+_NODE_COLOR = "#AFAFAF"
+_EDGE_MINIMUM_GREY = 0.15
+_EDGE_MINIMUM_WEIGHT = 0.1
+
+dcgrph_visualize_defaults = MappingProxyType(
+    {
+        # node_defaults:
+        "node_labels": None,
+        "node_label_position": "center",
+        "node_shape": "ellipse",
+        "node_size": 90,
+        # 'node_size_basic': 100,
+        "node_color": _NODE_COLOR,
+        "node_font_size": 15,
+        "node_minimum_size": 1,
+        "node_variable_size": 40,
+        "node_border_width": 0,
+        "node_fill_border_width": 1.5,  # used when partially filling a node
+        "node_border_style": None,  # 'solid',
+        "node_border_color": "black",
+        "node_font_weight": 550,
+        # edge defaults:
+        "edge_labels": None,
+        "edge_width": 7,
+        "edge_width_basic": 1,
+        "edge_color": "black",
+        "edge_arrow_color": "black",
+        "edge_arrowsize": 1,
+        "edge_arrowstyle": "triangle",
+        "edge_style": "bezier",
+        "edge_linestyle": "solid",
+        # replacing dotted by larger spaced dashes
+        "edge_dot_repl_pattern": [6, 6],
+        "edge_minimum_width": 0.5,
+        "edge_minimum_grey": _EDGE_MINIMUM_GREY,
+        "edge_minimum_weight": _EDGE_MINIMUM_WEIGHT,
+    }
+)
 """:mod:`~tessif.visualize.dcgrph` drawing defaults."""
 
 nxgrph_visualize_tags = nts.AttributeGroupings("node_", "edge_", "legend_")
@@ -228,156 +243,83 @@ Currently used exceptions:
     :stub-columns: 1
 """
 
-
-nx_label_kwargs = {
-    "nodes": [
-        "ax",
-        "nodelist",
-        "node_size",
-        "node_fill_size",
-        "node_color",
-        "node_shape",
-        "alpha",
-        "cmap",
-        "vmin",
-        "vmax",
-        "linewidts",
-        "edgecolors",
-        "label",
-    ],
-    "labels": [
-        "labels",
-        "font_size",
-        "font_color",
-        "font_family",
-        "font_weight",
-        "alpha",
-        "horizontalalignment",
-        "verticalalignment",
-        "ax",
-    ],
-    "edges": [
-        "edglist",
-        "width",
-        "edge_color",
-        "style",
-        "alpha",
-        "edge_cmap",
-        "edge_vmin",
-        "edge_vmax",
-        "ax",
-        "arrows",
-        "arrowstyle",
-        "arrowsize",
-        "connectionstyle",
-        "label",
-        "min_source_margin",
-        "min_target_margin",
-        # following kwargs are needed for estimating edge size
-        "node_shape",
-        "node_size",
-        "nodelist",
-    ],
-    "edge_labels": [
-        "ax",
-        "alpha",
-        "edge_labels",
-        "label_pos",
-        "font_size",
-        "font_color",
-        "font_weight",
-        "font_family",
-        "bbox",
-        "clip_on",
-        "horizontalalignment",
-        "verticalalignment",
-    ],
-}
-"""
-Registered :mod:`nxgrph.draw_graph <tessif.visualize.nxgrph.draw_graph>`
-key word arguments keyed by respective sub drawing utility name. Used for
-filtering out incompatible key word arguments. Explicitly stated
-here for easily maintained and expanded code.
-
-Currently used exceptions:
-
-.. csv-table:: first column labels the keys
-    :file: docs/source/csvs/defaults/nx_label_kwargs.csv
-    :stub-columns: 1
-"""
-
-energy_system_nodes = {
-    # Unique Identifiers
-    "name": "unspecified",
-    "latitude": 0.0,
-    "longitude": 0.0,
-    "region": None,
-    "sector": None,
-    "carrier": None,
-    "component": None,
-    "node_type": None,
-    "unspecified": "Unspecified",
-    # time serieses
-    "timeseries": None,
-    # singular values
-    "accumulated_maximum": float("+inf"),
-    "accumulated_minimum": 0.0,
-    "active": 1,
-    "characteristic_value": None,
-    "costs_for_being_active": 0.0,
-    "efficiency": 1.0,
-    "emissions": 0.0,
-    "exogenously_set": False,
-    "exogenously_set_value": 0,
-    "expandable": False,
-    "fixed_expansion_ratios": True,
-    "expansion_costs": 0.0,
-    "flow_costs": 0.0,
-    "final_soc": None,
-    "gain_rate": 0.0,
-    "initial_soc": 0.0,
-    "initial_status": 1,
-    "input": None,
-    "interfaces": None,
-    "installed_capacity": 0.0,
-    "loss_rate": 0.0,
-    "maximum": float("+inf"),
-    "maximum_efficiency": 1.0,
-    "maximum_expansion": float("+inf"),
-    "maximum_flow_rate": float("+inf"),
-    "maximum_shutdowns": float("+inf"),
-    "maximum_startups": float("+inf"),
-    "minimum": 0.0,
-    "minimum_efficiency": 0.01,
-    "minimum_expansion": 0.0,
-    "minimum_flow_rate": 0.0,
-    "minimum_downtime": 0,
-    "minimum_uptime": 0,
-    "negative_gradient": float("+inf"),
-    "negative_gradient_costs": 0.0,
-    "output": None,
-    "positive_gradient": float("+inf"),
-    "positive_gradient_costs": 0.0,
-    "shutdown_costs": 0.0,
-    "startup_costs": 0.0,
-    "storage_capacity": 0.0,
-    "variable_capacity": None,
-    # chp values
-    "chp_back_pressure": None,
-    "chp_efficiency": {},
-    "el_efficiency_wo_dist_heat": nts.MinMax(None, None),
-    "enthalpy_loss": nts.MinMax(None, None),
-    "min_condenser_load": None,
-    "power_loss_index": None,
-    "power_wo_dist_heat": nts.MinMax(None, None),
-    # model specific
-    "already_installed": 0.0,
-    "back_pressure": False,
-    "ideal": False,
-    "milp": False,
-    "number_of_connections": 1,
-    "fine_region": "Default Region",
-}
+# immutable, so a single instance is shared by all unset MinMax defaults
+_NONE_MINMAX = nts.MinMax(None, None)
+
+energy_system_nodes = MappingProxyType(
+    {
+        # Unique Identifiers
+        "name": "unspecified",
+        "latitude": 0.0,
+        "longitude": 0.0,
+        "region": None,
+        "sector": None,
+        "carrier": None,
+        "component": None,
+        "node_type": None,
+        "unspecified": "Unspecified",
+        # time serieses
+        "timeseries": None,
+        # singular values
+        "accumulated_maximum": math.inf,
+        "accumulated_minimum": 0.0,
+        "active": 1,
+        "characteristic_value": None,
+        "costs_for_being_active": 0.0,
+        "efficiency": 1.0,
+        "emissions": 0.0,
+        "exogenously_set": False,
+        "exogenously_set_value": 0,
+        "expandable": False,
+        "fixed_expansion_ratios": True,
+        "expansion_costs": 0.0,
+        "flow_costs": 0.0,
+        "final_soc": None,
+        "gain_rate": 0.0,
+        "initial_soc": 0.0,
+        "initial_status": 1,
+        "input": None,
+        "interfaces": None,
+        "installed_capacity": 0.0,
+        "loss_rate": 0.0,
+        "maximum": math.inf,
+        "maximum_efficiency": 1.0,
+        "maximum_expansion": math.inf,
+        "maximum_flow_rate": math.inf,
+        "maximum_shutdowns": math.inf,
+        "maximum_startups": math.inf,
+        "minimum": 0.0,
+        "minimum_efficiency": 0.01,
+        "minimum_expansion": 0.0,
+        "minimum_flow_rate": 0.0,
+        "minimum_downtime": 0,
+        "minimum_uptime": 0,
+        "negative_gradient": math.inf,
+        "negative_gradient_costs": 0.0,
+        "output": None,
+        "positive_gradient": math.inf,
+        "positive_gradient_costs": 0.0,
+        "shutdown_costs": 0.0,
+        "startup_costs": 0.0,
+        "storage_capacity": 0.0,
+        "variable_capacity": None,
+        # chp values
+        "chp_back_pressure": None,
+        "chp_efficiency": {},
+        "el_efficiency_wo_dist_heat": _NONE_MINMAX,
+        "enthalpy_loss": _NONE_MINMAX,
+        "min_condenser_load": None,
+        "power_loss_index": None,
+        "power_wo_dist_heat": _NONE_MINMAX,
+        # model specific
+        "already_installed": 0.0,
+        "back_pressure": False,
+        "ideal": False,
+        "milp": False,
+        "number_of_connections": 1,
+        "fine_region": "Default Region",
+    }
+)
 """
 Fallback defaults for creating energy system nodes.
 
@@ -445,48 +387,167 @@ specialised parsers exists or can be added.
     :stub-columns: 1
 """
 
-registered_essmos = {
-    "omf": oemof_spellings,
-    "ppsa": pypsa_spellings,
-    "fine": fine_spellings,
-    "cllp": calliope_spellings,
-}
+
+def _index_component_types(*component_types):
+    """Map each identifier to the component types it is registered for."""
+    index = {}
+    for component_type_mapping in component_types:
+        for component_type, identifiers in component_type_mapping.items():
+            for identifier in sorted(identifiers):
+                index[identifier] = (*index.get(identifier, ()), component_type)
+    return index
+
+
+component_types_by_identifier = _index_component_types(
+    registered_component_types, addon_component_types
+)
 """
-Registered Energy Supply System Modelling and Optimization Software (ESSMOS)
-and their recognized spelling variations.
+Reverse index of :attr:`registered_component_types` and
+:attr:`addon_component_types`.
+
+Maps each identifier to the tuple of component types it is associated with,
+so classifying an identifier is a single lookup. Most identifiers belong to a
+single component type, but e.g. ``"export"`` is registered for both
+``"sink"`` and ``"source"``::
+
+    from tessif.frused.defaults import component_types_by_identifier
+    print(component_types_by_identifier["export"])
+    ('sink', 'source')
+"""
+
+component_identifier_pattern = re.compile(
+    r"\b(?:"
+    # longest first, so no identifier is shadowed by one of its prefixes
+    + "|".join(
+        re.escape(identifier)
+        for identifier in sorted(component_types_by_identifier, key=len, reverse=True)
+    )
+    + r")\b",
+    re.IGNORECASE,
+)
+"""
+Compiled pattern matching any registered component identifier.
 
-See Also
---------
-:ref:`SupportedESSMOS`
+Finds the identifiers of :attr:`component_types_by_identifier` in free text
+using a single regex search, instead of testing each identifier one by one::
+
+    from tessif.frused.defaults import (
+        component_identifier_pattern, component_types_by_identifier)
+    match = component_identifier_pattern.search("Power Demand Berlin")
+    print(component_types_by_identifier[match.group(0).lower()])
+    ('sink',)
 """
 
+
+def _create_nxgrph_visualize_defaults():
+    """Create the nxgrph drawing defaults, importing matplotlib only now."""
+    from matplotlib import cm
+
+    return MappingProxyType(
+        {
+            # node_defaults:
+            "node_labels": None,
+            "node_shape": "o",
+            "node_size": 3000,
+            "node_minimum_size": 0.1 * 3000,
+            "node_variable_size_scaling": 0.5,
+            "node_fill_size": 3000,
+            "node_color": _NODE_COLOR,
+            "node_color_map": [_NODE_COLOR],
+            "node_alpha": 1.0,
+            "node_font_size": 11,
+            "node_font_weight": "light",
+            # edge defaults:
+            "edge_labels": None,
+            "edge_width": 1,
+            "edge_color": "black",
+            "edge_arrowstyle": "simple",
+            "edge_arrowsize": 7,
+            "edge_vmin": 0.0,
+            "edge_vmax": 1.0,
+            "edge_cmap": cm.Greys,
+            "edge_len": 1.0,
+            "edge_minimum_grey": _EDGE_MINIMUM_GREY,
+            "edge_minimum_weight": _EDGE_MINIMUM_WEIGHT,
+            "edge_minimum_width": 0.1,
+            # legend defaults:
+            "legend_labelspacing": 1,
+            "legend_title": None,
+            "legend_bbox_to_anchor": (1.0, 1),
+            "legend_loc": "best",
+            "legend_borderaxespad": 0,
+        }
+    )
+
+
+def _create_registered_essmos():
+    """Map the registered ESSMOS to their recognized spelling variations."""
+    from tessif.frused import spellings
+
+    return MappingProxyType(
+        {
+            "omf": tuple(spellings.oemof),
+            "ppsa": tuple(spellings.pypsa),
+            "fine": tuple(spellings.fine),
+            "cllp": tuple(spellings.calliope),
+        }
+    )
+
+
+def _create_essmos_by_spelling():
+    """Map each lower cased ESSMOS spelling variation to its ESSMOS key."""
+    # module attribute access creates registered_essmos only if needed
+    registered_essmos = getattr(sys.modules[__name__], "registered_essmos")
+    return {
+        spelling.lower(): essmos
+        for essmos, spellings in registered_essmos.items()
+        for spelling in spellings
+    }
+
+
+_lazy_defaults = {
+    "nxgrph_visualize_defaults": _create_nxgrph_visualize_defaults,
+    "registered_essmos": _create_registered_essmos,
+    "essmos_by_spelling": _create_essmos_by_spelling,
+}
+
+
+def __getattr__(name):
+    """Create the lazy defaults on first access (PEP 562)."""
+    if name in _lazy_defaults:
+        value = _lazy_defaults[name]()
+        # cache as module attribute, so __getattr__ is not called again
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# canonical plugin names and their recognized spelling variations
+_PLUGIN_ALIASES = (
+    ("tessif-oemof-4-4", ("oemof-4.4", "oemof-latest", "oemof", "omf")),
+    ("tessif-pypsa-0-19-3", ("pypsa-0-19-3", "pypsa-latest", "pypsa", "ppsa")),
+    ("tessif-fine-2-2-2", ("fine-2-2-2", "fine-latest", "fine", "fn")),
+    (
+        "tessif-calliope-0-6-6post1",
+        ("calliope-0-6-6post1", "calliope-latest", "calliope", "cllp"),
+    ),
+)
+
 registered_plugins = {
-    # omeof
-    "tessif-oemof-4-4": "tessif-oemof-4-4",
-    "oemof-4.4": "tessif-oemof-4-4",
-    "omeof-latest": "tessif-oemof-4-4",
-    "oemof": "tessif-oemof-4-4",
-    "omf": "tessif-oemof-4-4",
-    # pypsa
-    "tessif-pypsa-0-19-3": "tessif-pypsa-0-19-3",
-    "pypsa-0-19-3": "tessif-pypsa-0-19-3",
-    "pypsa-latest": "tessif-pypsa-0-19-3",
-    "pypsa": "tessif-pypsa-0-19-3",
-    "ppsa": "tessif-pypsa-0-19-3",
-    # fine
-    "tessif-fine-2-2-2": "tessif-fine-2-2-2",
-    "fine-2-2-2": "tessif-fine-2-2-2",
-    "fine-latest": "tessif-fine-2-2-2",
-    "fine": "tessif-fine-2-2-2",
-    "fn": "tessif-fine-2-2-2",
-    # calliope
-    "tessif-calliope-0-6-6post1": "tessif-calliope-0-6-6post1",
-    "calliope-0-6-6post1": "tessif-calliope-0-6-6post1",
-    "calliope-latest": "tessif-calliope-0-6-6post1",
-    "calliope": "tessif-calliope-0-6-6post1",
-    "cllp": "tessif-calliope-0-6-6post1",
+    alias.lower(): plugin
+    for plugin, aliases in _PLUGIN_ALIASES
+    for alias in (plugin, *aliases)
 }
 """
 Registered Energy Supply System Modelling and Optimization Software (ESSMOS)
 and their recognized spelling variations.
 """
+
+
+def resolve_plugin(name):
+    """Return the plugin registered as name, or None if it is not recognized.
+
+    Surrounding whitespace and case are ignored, so ``" Oemof "`` resolves
+    to ``"tessif-oemof-4-4"``.
+    """
+    return registered_plugins.get(name.strip().lower())
@@ -33,28 +33,40 @@ things.
    SimulationProcessStepResults
 """
 import collections
+import operator
+import sys
 import typing
+from types import MappingProxyType
 
 import tessif.frused.configurations as config
 
 
+def _intern(value):
+    """Intern value if it is a string."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class UidBase(typing.NamedTuple):
     """Base UId."""
 
     name: str
-    latitude: float
-    longitude: float
-    region: str
-    sector: str
-    carrier: str
-    component: str
-    node_type: str
+    latitude: float = None
+    longitude: float = None
+    region: str = None
+    sector: str = None
+    carrier: str = None
+    component: str = None
+    node_type: str = None
 
     def __str__(self):
         """Redefine string representation to parameterize desired output."""
-        return config.node_uid_seperator.join(
-            str(getattr(self, i)) for i in node_uid_styles[config.node_uid_style]
-        )
+        style = config.node_uid_style
+        formatter = _uid_formatters.get(style)
+        if formatter is None:
+            formatter = _uid_formatters[style] = _create_uid_formatter(
+                node_uid_styles[style]
+            )
+        return formatter(self, config.node_uid_seperator)
 
 
 class Uid(UidBase):
@@ -141,56 +153,63 @@ class Uid(UidBase):
         component=None,
         node_type=None,
     ):
-        """Create UID through seperate class to improve documentation."""
-        self = super().__new__(
+        """Create UID, interning its categorization strings.
+
+        The categorization strings take on only a few distinct values, so
+        interning them shares one string object among all uids of the same
+        category. The (usually unique) name is not interned.
+        """
+        return tuple.__new__(
             cls,
-            name,
-            latitude,
-            longitude,
-            region,
-            sector,
-            carrier,
-            component,
-            node_type,
+            (
+                name,
+                latitude,
+                longitude,
+                _intern(region),
+                _intern(sector),
+                _intern(carrier),
+                _intern(component),
+                _intern(node_type),
+            ),
         )
 
-        return self
+    @classmethod
+    def from_row(cls, row):
+        """Create UID from a row of positional uid components.
+
+        Rows shorter than the number of uid components are padded with
+        ``None``. Cheaper than keyword construction, so prefer it when
+        creating uids in bulk, like when transforming or deserializing data.
+        """
+        row = tuple(row)
+        row += (None,) * (len(cls._fields) - len(row))
+        # intern the categorization strings, like __new__ does
+        return cls._make(row[:3] + tuple(map(_intern, row[3:])))
 
     @classmethod
     def reconstruct(cls, string_representation):
         """Reconstruct UID from its :ref:`string representation <Labeling_Concept>`."""
-        deconstructed_uid = string_representation.split(config.node_uid_seperator)
-        dict_representation = dict()
-        for pos, attr in enumerate(node_uid_styles[config.node_uid_style]):
-            if pos > len(deconstructed_uid) - 1:
-                msg = (
-                    "Index out of range\n"
-                    + "The node_uid_style specificiation needs to be done "
-                    + "BEFORE constructing a Uid implying it also needs to be "
-                    + "Done BEFORE CREATING a model specific energy system\n"
-                    + "(Use 'qualname' before constructing the model specific "
-                    + "energy system and use more specified styles before "
-                    + "attempting a Uid reconstruction.)"
-                )
-                raise IndexError(msg)
-
-            dict_representation[attr] = deconstructed_uid[pos]
-
-        return cls(**dict_representation)
-
-
-node_uid_styles = {
-    "name": ["name"],
-    "qualname": [
-        i for i in Uid.__new__.__code__.co_varnames if i not in ["self", "cls"]
-    ],
-    "coords": ["name", "latitude", "longitude"],
-    "region": ["name", "region"],
-    "sector": ["name", "sector"],
-    "carrier": ["name", "carrier"],
-    "component": ["name", "component"],
-    "node_type": ["name", "node_type"],
-}
+        style = config.node_uid_style
+        reconstructor = _uid_reconstructors.get(style)
+        if reconstructor is None:
+            reconstructor = _uid_reconstructors[style] = _create_uid_reconstructor(
+                node_uid_styles[style]
+            )
+        return reconstructor(cls, string_representation, config.node_uid_seperator)
+
+
+node_uid_styles = MappingProxyType(
+    {
+        "name": ("name",),
+        "qualname": UidBase._fields,
+        "coords": ("name", "latitude", "longitude"),
+        "region": ("name", "region"),
+        "sector": ("name", "sector"),
+        "carrier": ("name", "carrier"),
+        "component": ("name", "component"),
+        "node_type": ("name", "node_type"),
+    }
+)
 """
 Provide possible internal node label representation styles. Use
 :attr:`configurations.node_uid_style
@@ -228,6 +247,60 @@ results into following representaion, depending on the mapping used::
     node_type -> test_renewable
 """
 
+
+def _create_uid_formatter(fields):
+    """Create a function joining the uid fields' string representations.
+
+    The fields are resolved to their tuple positions once, so formatting
+    indexes the uid instead of looking up its attributes by name.
+    """
+    positions = [UidBase._fields.index(field) for field in fields]
+
+    if len(positions) == 1:
+        (position,) = positions
+
+        def format_uid(uid, seperator):
+            return str(uid[position])
+
+    else:
+        get_fields = operator.itemgetter(*positions)
+
+        def format_uid(uid, seperator):
+            return seperator.join(map(str, get_fields(uid)))
+
+    return format_uid
+
+
+# uid formatters keyed by node_uid_styles key, created on first use
+_uid_formatters = {}
+
+
+def _create_uid_reconstructor(fields):
+    """Create a function reconstructing uids of the given fields."""
+    number_of_fields = len(fields)
+
+    def reconstruct_uid(cls, string_representation, seperator):
+        deconstructed_uid = string_representation.split(seperator)
+        if len(deconstructed_uid) < number_of_fields:
+            msg = (
+                "Index out of range\n"
+                + "The node_uid_style specificiation needs to be done "
+                + "BEFORE constructing a Uid implying it also needs to be "
+                + "Done BEFORE CREATING a model specific energy system\n"
+                + "(Use 'qualname' before constructing the model specific "
+                + "energy system and use more specified styles before "
+                + "attempting a Uid reconstruction.)"
+            )
+            raise IndexError(msg)
+
+        return cls(**dict(zip(fields, deconstructed_uid)))
+
+    return reconstruct_uid
+
+
+# uid reconstructors keyed by node_uid_styles key, created on first use
+_uid_reconstructors = {}
+
 Edge = collections.namedtuple("Edge", ["source", "target"])
 """
 Edge of an energy system graph. (source, target)
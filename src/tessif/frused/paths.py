@@ -5,13 +5,13 @@
 frequently used path implementations for conveniently accessing utilities and
 data coming with tessif.
 """
-import inspect
+import fnmatch
+import functools
+import itertools
 import os
 import pathlib
 import sys
 
-import ittools
-
 
 def find_subpath_incwd(
     path,
@@ -44,8 +44,19 @@ def find_subpath_incwd(
     ------
     found_paths : list
         List of found paths
+
+    Note
+    ----
+    The found paths are cached per path, includes, excludes and working
+    directory, so the file system is walked only once for each of them.
+    Call ``find_subpath_incwd.cache_clear()`` to walk it again.
     """
-    excludes = ittools.itrify(excludes)
+    # treat a single string as one in- or exclude, not as its characters
+    if isinstance(includes, str):
+        includes = (includes,)
+    if isinstance(excludes, str):
+        excludes = (excludes,)
+
     if getattr(sys, "frozen", False):
         # The application is frozen
         datadir = os.path.dirname(sys.executable)
@@ -55,25 +66,47 @@ def find_subpath_incwd(
         # Change this bit to match where you store your data files:
         datadir = os.path.dirname(os.getcwd())
 
-    candidates = list(
-        pathlib.Path(pathlib.Path(datadir).parent).glob(os.path.join("**", path))
-    )
-
-    found_paths = [
-        candidate.as_posix()
-        for candidate in candidates
-        if not any(exclude in candidate.as_posix() for exclude in excludes)
-        and all(include in candidate.as_posix() for include in includes)
-    ]
-    return found_paths
-
-
-root_dir = os.path.normpath(
-    os.path.join(
-        inspect.getfile(inspect.currentframe()).split("paths")[0],
-        "..",
-    )
-)
+    return list(_find_subpaths(path, tuple(includes), tuple(excludes), datadir))
+
+
+@functools.lru_cache(maxsize=256)
+def _find_subpaths(path, includes, excludes, datadir):
+    """Walk the datadir's parent for path, caching the found paths."""
+    path_name = pathlib.PurePath(path).name
+    found_paths = []
+    for dirpath, dirnames, filenames in os.walk(os.path.dirname(datadir)):
+        # prune excluded directories before descending into them, since
+        # every path found inside of them would be excluded anyway
+        dirnames[:] = [
+            dirname
+            for dirname in dirnames
+            if not any(exclude in dirname for exclude in excludes)
+        ]
+
+        for name in itertools.chain(dirnames, filenames):
+            # only create path objects for entries of matching name ...
+            if not fnmatch.fnmatch(name, path_name):
+                continue
+
+            # ... to match the path's trailing parts, like "**/path" does
+            candidate = pathlib.PurePath(dirpath, name)
+            if not candidate.match(path):
+                continue
+
+            candidate = candidate.as_posix()
+            if not any(exclude in candidate for exclude in excludes) and all(
+                include in candidate for include in includes
+            ):
+                found_paths.append(candidate)
+
+    return tuple(found_paths)
+
+
+# allow dropping the cached results, like for any lru_cache decorated function
+find_subpath_incwd.cache_clear = _find_subpaths.cache_clear
+
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 """ Tessif's root directory."""
 
 tessif_dir = os.path.join(os.path.expanduser("~"), ".tessif.d")
@@ -4,8 +4,9 @@
 :mod:`~tessif.frused.resolutions` is a :mod:`tessif` aggregating frequently
 needed temporal resolution parameters.
 """
+from types import MappingProxyType
 
-temporal_support = [
+temporal_support = (
     "daily",
     "hourly",
     "30min",
@@ -18,7 +19,7 @@ temporal_support = [
     "10s",
     "5s",
     "s",
-]
+)
 """
 Supported temporal resolution aliases. Use
 :attr:`~tessif.frused.resolutions.temporals` for accessing them.
@@ -28,7 +29,7 @@ Supported temporal resolution aliases. Use
 """
 
 
-temporals = {i: i for i in temporal_support}
+temporals = MappingProxyType({i: i for i in temporal_support})
 """
 Mapping temporal support tags to themself for failsafe resolution access.
 
@@ -40,20 +41,22 @@ Mapping temporal support tags to themself for failsafe resolution access.
 #: `Rounding Aliases
 #: <https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#offset-aliases>`_
 #: for supported temporal resolutions.
-temporal_rounding_map = {
-    "daily": "D",
-    "hourly": "H",
-    "30min": "30min",
-    "15min": "15min",
-    "10min": "10min",
-    "5min": "5min",
-    "min": "min",
-    "30s": "30S",
-    "15s": "15S",
-    "10s": "10S",
-    "5s": "5S",
-    "s": "S",
-}
+temporal_rounding_map = MappingProxyType(
+    {
+        "daily": "D",
+        "hourly": "H",
+        "30min": "30min",
+        "15min": "15min",
+        "10min": "10min",
+        "5min": "5min",
+        "min": "min",
+        "30s": "30S",
+        "15s": "15S",
+        "10s": "10S",
+        "5s": "5S",
+        "s": "S",
+    }
+)
 """
 `Rounding aliases
 <https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#offset-aliases>`_
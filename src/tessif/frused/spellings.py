@@ -3584,7 +3584,7 @@ def match_key_from(mppng, smth_like, dflt=None):
     log_level = logging.DEBUG
 
     logger.debug(50 * "-")
-    logger.debug(f"Try getting a key similiar to {smth_like}...")
+    logger.debug("Try getting a key similiar to %s...", smth_like)
 
     if smth_like in globals():
 
@@ -3593,7 +3593,7 @@ def match_key_from(mppng, smth_like, dflt=None):
 
         for variation in globals()[smth_like]:
             if variation in mppng.keys():
-                logger.debug(f"... found {variation}")
+                logger.debug("... found %s", variation)
                 logger.debug(50 * "-")
                 return variation
 
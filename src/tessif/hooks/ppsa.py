@@ -6,6 +6,71 @@
 into tessif.
 """
 import numpy as np
+import pandas as pd
+
+# attribute row templates, ordered like the pypsa component attribute columns:
+# type, unit, default, docstring, input output and required/optional
+_FLOW_EMISSIONS_ROW = (
+    "static",
+    "t_CO2eq/MW",
+    0.0,
+    "flow specific emissions",
+    "Input (optional)",
+)
+_FLOW_COSTS_ROW = ("static", "€/MW", 0.0, "flow specific costs", "Input (optional)")
+_EXPANSION_COSTS_ROW = ("static", "€/MW", 0.0, "expansion cost", "Input (optional)")
+_SISO_TRANSFORMER_ROW = (
+    "bool",
+    np.nan,
+    False,
+    "Link has 1 input and 1 output",
+    "Input (optional)",
+)
+_MULTIPLE_OUTPUTS_ROW = (
+    "bool",
+    np.nan,
+    False,
+    "Link uses multiple outputs",
+    "Input (optional)",
+)
+
+# rows added for each additional link interface, keyed by the attribute name
+# prefix, which is suffixed by the interface's bus number
+_LINK_INTERFACE_ROWS = (
+    # connecting bus attribute
+    ("bus", ("string", np.nan, np.nan, "2nd bus", "Input (optional)")),
+    # bus 0 to 2+i efficiency
+    (
+        "efficiency",
+        ("static or series", "per unit", 1.0, "2nd bus efficiency", "Input (optional)"),
+    ),
+    # bus 0 to 2+i flow costs
+    ("flow_costs", ("static", "€/MW", 0.0, "addit. flow cost", "Input (optional)")),
+    # bus 0 to 2+i flow emissions
+    (
+        "flow_emissions",
+        ("static", "t_CO2/MW", 0.0, "addit. flow cost", "Input (optional)"),
+    ),
+    # bus 0 to 2+i installed capacities
+    ("p_nom", ("static", "MW", 0.0, "addit. capacity", "Input (optional)")),
+    # bus 0 to 2+i expansion cost
+    (
+        "expansion_costs",
+        ("static", "€/MW", 0.0, "2nd expansion cost", "Input (optional)"),
+    ),
+    # bus 0 to 2+i result
+    ("p", ("series", "MW", 0.0, "2nd bus output", "Output")),
+)
+
+
+def _extend_attributes(attributes, rows):
+    """Add or overwrite the attribute rows in one go.
+
+    Concatenating all rows at once reallocates the attribute dataframe only
+    once, instead of once for each ``attributes.loc[row] = ...`` assignment.
+    """
+    rows = pd.DataFrame.from_dict(rows, orient="index", columns=attributes.columns)
+    return pd.concat([attributes.drop(index=rows.index, errors="ignore"), rows])
 
 
 def add_flow_bound_emissions(attribute_dict):
@@ -41,13 +106,10 @@ def add_flow_bound_emissions(attribute_dict):
 
     # bus flow emissions
     for component in co2_bound_components:
-        attribute_dict[component].loc["flow_emissions"] = [
-            "static",  # type
-            "t_CO2eq/MW",  # unit
-            0.0,  # default
-            "flow specific emissions",  # docstring
-            "Input (optional)",  # input output and required/optional
-        ]
+        attribute_dict[component] = _extend_attributes(
+            attribute_dict[component],
+            {"flow_emissions": _FLOW_EMISSIONS_ROW},
+        )
 
     return attribute_dict
 
@@ -84,31 +146,20 @@ def add_siso_transfromer_type(attribute_dict):
 
     # bus flow emissions
     for component in siso_transformer_components:
-        # adding the option to tell the post processors about multiple inputs
-        attribute_dict[component].loc["siso_transformer"] = [
-            "bool",  # type
-            np.nan,  # unit
-            False,  # default
-            "Link has 1 input and 1 output",  # docstring
-            # input output and required/optional
-            "Input (optional)",
-        ]
-
-        attribute_dict[component].loc["flow_costs"] = [
-            "static",  # type
-            "€/MW",  # unit
-            0.0,  # default
-            "flow specific costs",  # docstring
-            "Input (optional)",  # input output and required/optional
-        ]
-
-        attribute_dict["Link"].loc["expansion_costs"] = [
-            "static",  # type
-            "€/MW",  # unit
-            0.0,  # default
-            "expansion cost",  # docstring
-            "Input (optional)",  # input output and required/optional
-        ]
+        attribute_dict[component] = _extend_attributes(
+            attribute_dict[component],
+            {
+                # adding the option to tell the post processors about
+                # multiple inputs
+                "siso_transformer": _SISO_TRANSFORMER_ROW,
+                "flow_costs": _FLOW_COSTS_ROW,
+            },
+        )
+
+    # expansion costs always extend the links
+    attribute_dict["Link"] = _extend_attributes(
+        attribute_dict["Link"], {"expansion_costs": _EXPANSION_COSTS_ROW}
+    )
 
     return attribute_dict
 
@@ -149,116 +200,24 @@ def extend_number_of_link_interfaces(attribute_dict, additional_interfaces=1):
         carrying the parameters for using flow bound emisison values.
 
     """
-    # bus 0 to 1 flow costs
-    attribute_dict["Link"].loc["flow_costs"] = [
-        "static",  # type
-        "€/MW",  # unit
-        0.0,  # default
-        "flow specific costs",  # docstring
-        "Input (optional)",  # input output and required/optional
-    ]
-
-    # bus 0 to 1 expansion cost
-    attribute_dict["Link"].loc["expansion_costs"] = [
-        "static",  # type
-        "€/MW",  # unit
-        0.0,  # default
-        "expansion cost",  # docstring
-        "Input (optional)",  # input output and required/optional
-    ]
-
-    # adding the option to tell the post processors about multiple outputs
-    attribute_dict["Link"].loc["multiple_outputs"] = [
-        "bool",  # type
-        np.nan,  # unit
-        False,  # default
-        "Link uses multiple outputs",  # docstring
-        "Input (optional)",  # input output and required/optional
-    ]
-
-    # # adding the option to tell the post processors about multiple inputs
-    # attribute_dict["Link"].loc["multiple_inputs"] = [
-    #     "bool",                        # type
-    #     np.nan,                        # unit
-    #     False,                         # default
-    #     "Link uses multiple inputs",  # docstring
-    #     "Input (optional)"             # input output and required/optional
-    # ]
-
-    # adding the option to tell the post processors about multiple inputs
-    attribute_dict["Link"].loc["siso_transformer"] = [
-        "bool",  # type
-        np.nan,  # unit
-        False,  # default
-        "Link has 1 input and 1 output",  # docstring
-        "Input (optional)",  # input output and required/optional
-    ]
+    # collect all link attribute rows, to add them in one go
+    rows = {
+        # bus 0 to 1 flow costs
+        "flow_costs": _FLOW_COSTS_ROW,
+        # bus 0 to 1 expansion cost
+        "expansion_costs": _EXPANSION_COSTS_ROW,
+        # adding the option to tell the post processors about multiple outputs
+        "multiple_outputs": _MULTIPLE_OUTPUTS_ROW,
+        # adding the option to tell the post processors about multiple inputs
+        "siso_transformer": _SISO_TRANSFORMER_ROW,
+    }
 
     # add a new link interface for each one requested:
     for i in range(additional_interfaces):
+        for prefix, row in _LINK_INTERFACE_ROWS:
+            rows[f"{prefix}{2+i}"] = row
 
-        # connecting bus attribute
-        attribute_dict["Link"].loc[f"bus{2+i}"] = [
-            "string",  # type
-            np.nan,  # unit
-            np.nan,  # default
-            "2nd bus",  # docstring
-            "Input (optional)",  # input/output and required/optional
-        ]
-
-        # bus 0 to 2+i efficiency
-        attribute_dict["Link"].loc[f"efficiency{2+i}"] = [
-            "static or series",  # type
-            "per unit",  # unit
-            1.0,  # default
-            "2nd bus efficiency",  # docstring
-            "Input (optional)",  # input/output and required/optional
-        ]
-
-        # bus 0 to 2+i flow costs
-        attribute_dict["Link"].loc[f"flow_costs{2+i}"] = [
-            "static",  # type
-            "€/MW",  # unit
-            0.0,  # default
-            "addit. flow cost",  # docstring
-            "Input (optional)",  # input output and required/optional
-        ]
-
-        # bus 0 to 2+i flow emissions
-        attribute_dict["Link"].loc[f"flow_emissions{2+i}"] = [
-            "static",  # type
-            "t_CO2/MW",  # unit
-            0.0,  # default
-            "addit. flow cost",  # docstring
-            "Input (optional)",  # input output and required/optional
-        ]
-
-        # bus 0 to 2+i installed capacities
-        attribute_dict["Link"].loc[f"p_nom{2+i}"] = [
-            "static",  # type
-            "MW",  # unit
-            0.0,  # default
-            "addit. capacity",  # docstring
-            "Input (optional)",  # input output and required/optional
-        ]
-
-        # bus 0 to 2+i expansion cost
-        attribute_dict["Link"].loc[f"expansion_costs{2+i}"] = [
-            "static",  # type
-            "€/MW",  # unit
-            0.0,  # default
-            "2nd expansion cost",  # docstring
-            "Input (optional)",  # input output and required/optional
-        ]
-
-        # bus 0 to 2+i result
-        attribute_dict["Link"].loc[f"p{2+i}"] = [
-            "series",  # type
-            "MW",  # unit
-            0.0,  # default
-            "2nd bus output",  # docstring
-            "Output",  # input output and required/optional
-        ]
+    attribute_dict["Link"] = _extend_attributes(attribute_dict["Link"], rows)
 
     return attribute_dict
 
@@ -8,8 +8,27 @@ change tessif energy systems after their creation.
 Usually used for auto comparing a singular tessif energy system on
 contradicting model assumptions. Like for example in :ref:`AutoCompare_HH`.
 """
+import functools
+
 import tessif.components as comps
-from tessif.system_model import AbstractEnergySystem
+
+
+@functools.lru_cache(maxsize=None)
+def _component_class(name):
+    """Return the :mod:`tessif.components` class called name."""
+    return getattr(comps, name)
+
+
+def _holds_parameters(attributes, parameters):
+    """Check if the attributes already hold all of the parameter values."""
+    try:
+        return all(
+            parameter in attributes and bool(attributes[parameter] == value)
+            for parameter, value in parameters.items()
+        )
+    except (TypeError, ValueError):
+        # array like comparisons are ambiguous, so consider them as changed
+        return False
 
 
 def reparameterize_components(es, components=None):
@@ -24,6 +43,13 @@ def reparameterize_components(es, components=None):
         combination by :attr:`component uid <tessif.frused.namedtuples.Uid>`
         string representation. If none, an empty dictionairy is used.
 
+    Return
+    ------
+    reparameterized_es: :class:`tessif.model.energy_system.AbstractEnergySystem`
+        The reparameterized energy system. If no component's parameters
+        actually change, :paramref:`~reparameterize_components.es` itself is
+        returned.
+
     Examples
     --------
     Use :ref:`tessifs example hub <Examples>` to create a minimum working
@@ -81,63 +107,49 @@ def reparameterize_components(es, components=None):
     """
     if not components:
         components = dict()
-    # turn generator into list for recreating the es later
-    nodes = list(es.nodes)
-    # iterate through the requested components...
-    for uid in components.keys():
-
-        # ... and through all nodes inside the es...
-        for idx, node in enumerate(nodes.copy()):
-
-            # ... to see if the requested component is inside the es
-            if uid == str(node.uid):
-
-                # yes it is, so ...
-                # create a uid mapping for recreating the component
-                comp_uid = node.uid._asdict()
 
-                # and copy all the attributes so they can be manipulated w/o
-                # interferring with the original es
-                attributes = node.attributes.copy()
+    # map the uid string representations to the nodes once, so the
+    # requested components are found without scanning all nodes each time
+    nodes = {str(node.uid): node for node in es.nodes}
 
-                # remove the uid part since it is handled above
-                attributes.pop("uid")
+    # reparameterized components keyed by the uid string representations of
+    # the components they replace
+    replacements = {}
 
-                # iterate over requested parameters
-                for parameter, value in components[uid].items():
-
-                    # print('changing parameter', parameter, # future log
-                    #       'of comp:', uid) # future log
-                    # print('from:', attributes[parameter]) # future log
-
-                    # and chang thir value acoordingly
-                    attributes[parameter] = value
-
-                    # print('to:', attributes[parameter]) # future log
-
-                # infer reparameterized components type in a way ...
-                ntype = str(type(node)).split(".")[-1].replace("'>", "")
-
-                # its constructor can be allocated dynamically
-                # and the reparameterized component created
-                new_comp = getattr(comps, ntype)(
-                    **comp_uid,
-                    **attributes,
-                )
-
-                # remove the old component from the list
-                nodes.pop(idx)
-
-                # and replace it by the new one
-                nodes.append(new_comp)
-
-    # recreate the enerergy system ...
-    reparameterized_es = AbstractEnergySystem.from_components(
-        uid=f"reparameterized_{es.uid}",
-        components=nodes,
-        timeframe=es.timeframe,
-        global_constraints=es.global_constraints,
-    )
-
-    # ... and return the now reparameterized energy system.
-    return reparameterized_es
+    # iterate through the requested components...
+    for uid, parameters in components.items():
+
+        # ... to see if the requested component is inside the es
+        node = nodes.get(uid)
+        if node is None:
+            continue
+
+        # yes it is, so skip it if its parameters do not change at all
+        if _holds_parameters(node.attributes, parameters):
+            continue
+
+        # create a uid mapping for recreating the component
+        comp_uid = node.uid._asdict()
+
+        # and merge the requested parameters into a copy of the attributes,
+        # so they can be manipulated w/o interferring with the original es
+        attributes = {**node.attributes, **parameters}
+
+        # remove the uid part since it is handled above
+        attributes.pop("uid")
+
+        # allocate the reparameterized component's constructor dynamically
+        # and create the reparameterized component
+        replacements[uid] = _component_class(type(node).__name__)(
+            **comp_uid,
+            **attributes,
+        )
+
+    # no need to recreate an unchanged energy system
+    if not replacements:
+        return es
+
+    # the reparameterized components keep their uids and types, so they can
+    # simply be swapped into a copy of the energy system, instead of
+    # recreating it from all of its components
+    return es.replace_nodes(replacements, uid=f"reparameterized_{es.uid}")
@@ -37,6 +37,7 @@ import logging
 
 # pylint: disable=S403
 import pickle
+import pickletools
 
 # pylint: enable=S403
 from collections import defaultdict
@@ -347,7 +348,7 @@ class ESTransformer(abc.ABC):
         #     attr_name: getattr(self, attr_name) for attr_name in edge_attribute_names
         # }
 
-    def pickle(self, location):
+    def pickle(self, location, protocol=None):
         """Pickle the resultier.
 
         Parameters
@@ -355,8 +356,17 @@ class ESTransformer(abc.ABC):
         location: str, default = None
             String representing of a path the Resultier is pickled
             to. Passed to: meth: `pickle.dump`.
+        protocol: int, None, default=None
+            Pickle protocol used. If None, :attr:`pickle.HIGHEST_PROTOCOL`
+            is used.
         """
-        pickle.dump(self, open(location, "wb"))
+        if protocol is None:
+            protocol = pickle.HIGHEST_PROTOCOL
+
+        with open(location, "wb") as pickle_file:
+            pickle_file.write(
+                pickletools.optimize(pickle.dumps(self, protocol=protocol))
+            )
 
     # @classmethod
     # def unpickle(cls, location):
@@ -2315,13 +2325,15 @@ class NodeFormatier(Resultier):
 
         if self._drawutil == "nx":
             # mappings for networkx
-            self._default_node_shapes = defaults.nxgrph_node_shapes
+            # copied, since the read-only default can not be serialized
+            self._default_node_shapes = dict(defaults.nxgrph_node_shapes)
             self._node_shape = self._map_nx_node_shapes()
             self._node_size = self._map_nx_node_sizes()
 
         # mappings for dash cytoscape
         if self._drawutil == "dc":
-            self._default_node_shapes = defaults.dcgrph_node_shapes
+            # copied, since the read-only default can not be serialized
+            self._default_node_shapes = dict(defaults.dcgrph_node_shapes)
             self._node_shape = self._map_dc_node_shapes()
             self._node_size = self._map_dc_node_sizes()
 
@@ -39,9 +39,13 @@ class ResultierEncoder(json.JSONEncoder):
         else:
             return obj
 
-    def encode(self, obj):
-        """Modify key parsing by calling _encode."""
-        return super().encode(self._encode(obj))
+    def iterencode(self, obj, _one_shot=False):
+        """Modify key parsing by calling _encode.
+
+        Used by :func:`json.dumps` as well as by :func:`json.dump`, so
+        resultiers can be streamed directly into a file.
+        """
+        return super().iterencode(self._encode(obj), _one_shot)
 
 
 class SystemModelEncoder(json.JSONEncoder):
@@ -30,13 +30,16 @@ Serving as primary input data harmonization.
    AbstractEnergySystem.unpickle
 """
 
+import copy
 import json
 
 # standard library
 import os
 import pickle
+import pickletools
 import subprocess
 import tempfile
+from collections import defaultdict
 
 import networkx as nx
 
@@ -47,8 +50,12 @@ import pandas as pd
 import tessif.components as tessif_components
 import tessif.frused.namedtuples as nts
 from tessif import nxgraph
-from tessif.deserialize import RestoredResults, SystemModelDecoder
-from tessif.frused.defaults import registered_plugins
+from tessif.deserialize import (
+    RestoredResults,
+    SystemModelDecoder,
+    load_tropp_json,
+)
+from tessif.frused.defaults import resolve_plugin
 from tessif.frused.paths import tessif_dir
 from tessif.serialize import SystemModelEncoder
 
@@ -263,25 +270,23 @@ class AbstractEnergySystem:
         :class:`NamedTuples<typing.Namedtuple>` representing graph like `edges
         <https://en.wikipedia.org/wiki/Glossary_of_graph_theory_terms#edge>`_.
         """
+        node_uids = self._node_uids_by_name()
+
         # All edge information are stored inside the bus objects..
         for bus in self.busses:
             # Bus incoming edge should contain node.uid and bus.uid:
             for inflow in bus.inputs:
-                # so find out node uid by string comparison with
-                # every single node:
-                for node in self.nodes:
-                    if inflow.split(".")[0] == node.uid.name:
-                        edge = nts.Edge(str(node.uid), str(bus.uid))
-                        yield edge
+                # so find out node uid by the node name it is stated with:
+                for node_uid in node_uids.get(inflow.split(".")[0], ()):
+                    edge = nts.Edge(node_uid, str(bus.uid))
+                    yield edge
 
             # Bus leaving edges should contain bus.uid and node.uid:
             for outflow in bus.outputs:
-                # so find out node uid by string comparison with
-                # every single node:
-                for node in self.nodes:
-                    if outflow.split(".")[0] == node.uid.name:
-                        edge = nts.Edge(str(bus.uid), str(node.uid))
-                        yield edge
+                # so find out node uid by the node name it is stated with:
+                for node_uid in node_uids.get(outflow.split(".")[0], ()):
+                    edge = nts.Edge(str(bus.uid), node_uid)
+                    yield edge
 
         # ... except for the edges build by the connectors
         for connector in self.connectors:
@@ -303,28 +308,38 @@ class AbstractEnergySystem:
         """
         return self._global_constraints
 
+    def _node_uids_by_name(self):
+        """Map node names to the uid string representations of their nodes.
+
+        Built once per call of :attr:`edges` and :meth:`_edge_carriers`
+        instead of scanning every node for each bus interface.
+        """
+        node_uids = defaultdict(list)
+        for node in self.nodes:
+            node_uids[node.uid.name].append(str(node.uid))
+
+        return node_uids
+
     def _edge_carriers(self):
         """Extract carrier information out of busses and connectors."""
         _ecarriers = {}
+        node_uids = self._node_uids_by_name()
+
         # All edge information are stored inside the bus objects
         for bus in self.busses:
             # Bus incoming edge should contain node.uid and bus.uid:
             for inflow in bus.inputs:
-                # so find out node uid by string comparison with
-                # every single node:
-                for node in self.nodes:
-                    if inflow.split(".")[0] == node.uid.name:
-                        edge = nts.Edge(str(node.uid), str(bus.uid))
-                        _ecarriers[edge] = inflow.split(".")[1]
+                # so find out node uid by the node name it is stated with:
+                for node_uid in node_uids.get(inflow.split(".")[0], ()):
+                    edge = nts.Edge(node_uid, str(bus.uid))
+                    _ecarriers[edge] = inflow.split(".")[1]
 
             # Bus leaving edges should contain bus.uid and node.uid:
             for outflow in bus.outputs:
-                # so find out node uid by string comparison with
-                # every single node:
-                for node in self.nodes:
-                    if outflow.split(".")[0] == node.uid.name:
-                        edge = nts.Edge(str(bus.uid), str(node.uid))
-                        _ecarriers[edge] = inflow.split(".")[1]
+                # so find out node uid by the node name it is stated with:
+                for node_uid in node_uids.get(outflow.split(".")[0], ()):
+                    edge = nts.Edge(str(bus.uid), node_uid)
+                    _ecarriers[edge] = inflow.split(".")[1]
 
         for connector in self.connectors:
             for inflow in connector.inputs:
@@ -443,6 +458,47 @@ class AbstractEnergySystem:
             global_constraints=self.global_constraints,
         )
 
+    def replace_nodes(self, nodes, uid=None):
+        """Return a copy of the energy system with some of its nodes replaced.
+
+        The copy shares all other nodes, its timeframe and its global
+        constraints with this energy system, so it is a lot cheaper to create
+        than a new one using :meth:`from_components`.
+
+        Parameters
+        ----------
+        nodes: dict
+            Replacing nodes keyed by the :attr:`uid
+            <tessif.frused.namedtuples.Uid>` string representations of the
+            nodes they replace. Each replacing node must be of the same
+            component type as the node it replaces.
+
+        uid: ~collections.abc.Hashable, None, default=None
+            Hashable unique identifier of the copy. If none, this energy
+            system's uid is used.
+
+        Return
+        ------
+        :class:`AbstractEnergySystem`
+            The energy system copy containing the replaced nodes.
+        """
+        replaced_es = copy.copy(self)
+
+        if uid is not None:
+            replaced_es._uid = uid
+
+        for component_type in self._plurals_mapping:
+            attribute = f"_{component_type}"
+            setattr(
+                replaced_es,
+                attribute,
+                tuple(
+                    nodes.get(str(node.uid), node) for node in getattr(self, attribute)
+                ),
+            )
+
+        return replaced_es
+
     @property
     def timeframe(self):
         """Timeframe representing the optimization time span."""
@@ -480,7 +536,12 @@ class AbstractEnergySystem:
     @classmethod
     def deserialize(cls, stream):
         """Load from stored system."""
-        system_dict = json.loads(stream)
+        system_dict = load_tropp_json(stream)
+
+        # one decoder for all components, json.loads(..., cls=...) would
+        # build a new decoder and scanner for each of them
+        decoder = SystemModelDecoder()
+
         for attribute_name, value in system_dict.copy().items():
 
             # deserialize uid
@@ -509,19 +570,19 @@ class AbstractEnergySystem:
                 list_of_jsoned_component_attributes = value
                 # map "busses" to bus, etc
                 component_type = cls._plurals_mapping[attribute_name]
-                system_dict[attribute_name] = []
-
-                for component_attributes in list_of_jsoned_component_attributes:
-                    system_dict[attribute_name].append(
-                        # recreate tessif components using "form_attributes"
-                        getattr(tessif_components, component_type).from_attributes(
-                            json.loads(component_attributes, cls=SystemModelDecoder)
-                        )
+                component_class = getattr(tessif_components, component_type)
+
+                # recreate tessif components using "form_attributes"
+                system_dict[attribute_name] = [
+                    component_class.from_attributes(
+                        decoder.decode(component_attributes)
                     )
+                    for component_attributes in list_of_jsoned_component_attributes
+                ]
 
         return cls(**system_dict)
 
-    def pickle(self, location):
+    def pickle(self, location, protocol=None):
         """Pickle this system model.
 
         Parameters
@@ -529,12 +590,22 @@ class AbstractEnergySystem:
         location: str, default = None
             String representing of a path the created system model is pickled
             to. Passed to: meth: `pickle.dump`.
+        protocol: int, None, default=None
+            Pickle protocol used. If None, :attr:`pickle.HIGHEST_PROTOCOL`
+            is used.
         """
-        pickle.dump(self.__dict__, open(location, "wb"))
+        if protocol is None:
+            protocol = pickle.HIGHEST_PROTOCOL
+
+        with open(location, "wb") as pickle_file:
+            pickle_file.write(
+                pickletools.optimize(pickle.dumps(self.__dict__, protocol=protocol))
+            )
 
     def unpickle(self, location):
         """Restore a pickled energy system object."""
-        self.__dict__ = pickle.load(open(location, "rb"))
+        with open(location, "rb") as pickle_file:
+            self.__dict__ = pickle.load(pickle_file)
 
     def tropp(
         self, plugins, trans_ops=None, opt_ops=None, quiet=False, parent_dir=None
@@ -573,10 +644,9 @@ class AbstractEnergySystem:
         sanitized_plugins = []
 
         for plugin in plugins:
-            if plugin not in registered_plugins.keys():
-                pass
-            else:
-                sanitized_plugins.append(registered_plugins[plugin])
+            registered_plugin = resolve_plugin(plugin)
+            if registered_plugin is not None:
+                sanitized_plugins.append(registered_plugin)
 
         # parse working directory
         if not parent_dir:
@@ -594,12 +664,10 @@ class AbstractEnergySystem:
                 # the pluging virtual environment
                 system_model_location = os.path.join(tempdir, "tessif_system_model.tsf")
 
-                serialized_sys_mod = self.serialize()
-
-                json.dump(
-                    serialized_sys_mod,
-                    fp=open(system_model_location, "w"),
-                )
+                # the serialized json string is stored as json string literal,
+                # the format plugin venvs of all tessif versions can read
+                with open(system_model_location, "w", buffering=1 << 20) as f:
+                    f.write(json.dumps(self.serialize()))
 
                 venv_dir = os.path.join(parent_dir, "plugin-venvs", rgstrd_plgn)
                 activation_script = os.path.join(venv_dir, "bin", "activate")
@@ -630,25 +698,19 @@ class AbstractEnergySystem:
                     check=True,
                 )
 
-                deserialized_results = json.loads(
-                    json.load(
-                        open(
-                            os.path.join(tempdir, f"{rgstrd_plgn}_all_resutlier.alr"),
-                        )
-                    )
-                )
+                with open(
+                    os.path.join(tempdir, f"{rgstrd_plgn}_all_resutlier.alr"), "rb"
+                ) as f:
+                    deserialized_results = load_tropp_json(f.read())
 
                 tropp_results[rgstrd_plgn]["alr"] = RestoredResults(
                     deserialized_results
                 )
 
-                deserialized_results = json.loads(
-                    json.load(
-                        open(
-                            os.path.join(tempdir, f"{rgstrd_plgn}_igr_resultier.igr"),
-                        ),
-                    ),
-                )
+                with open(
+                    os.path.join(tempdir, f"{rgstrd_plgn}_igr_resultier.igr"), "rb"
+                ) as f:
+                    deserialized_results = load_tropp_json(f.read())
 
                 tropp_results[rgstrd_plgn]["igr"] = RestoredResults(
                     deserialized_results
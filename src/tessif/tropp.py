@@ -1,12 +1,25 @@
 # src/tessif/tropp.py
 """Tessif's TRansform Optimize and Post-Process warppers."""
 
+import functools
 import importlib
 import json
 
 import tessif.frused.configurations
 
 
+@functools.lru_cache(maxsize=None)
+def _load_plugin(plugin):
+    """Import and return the plugin's top level module."""
+    return importlib.import_module(plugin.replace("-", "_"))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_post_process(plugin):
+    """Import and return the plugin's post processing module."""
+    return importlib.import_module(f"{plugin.replace('-', '_')}.post_process")
+
+
 def transform(tessif_system_model, plugin, trans_ops=None, node_uid_style="name"):
     """
     Transform a tessif system model into one of the registered ESSMOS plugins.
@@ -25,8 +38,7 @@ def transform(tessif_system_model, plugin, trans_ops=None, node_uid_style="name"
         See also :attr:`tessif.frused.namedtuples.node_uid_styles`
     """
     # perform runtime import
-    module_name = plugin.replace("-", "_")
-    plugin_module = importlib.import_module(module_name)
+    plugin_module = _load_plugin(plugin)
 
     # respect udi style
     tessif.frused.configurations.node_uid_style = node_uid_style
@@ -53,8 +65,7 @@ def optimize(plugin_system_model, plugin, opt_ops=None):
     opt_ops : dict
         Dictionairy holding solver options.
     """
-    module_name = plugin.replace("-", "_")
-    plugin_module = importlib.import_module(module_name)
+    plugin_module = _load_plugin(plugin)
 
     optimized_system_model = plugin_module.optimize(plugin_system_model)
 
@@ -63,10 +74,7 @@ def optimize(plugin_system_model, plugin, opt_ops=None):
 
 def post_process(optimized_plugin_system_model, plugin):
     """Help."""
-    module_name = plugin.replace("-", "_")
-    # plugin_module = importlib.import_module(module_name)
-
-    post_process = importlib.import_module(f"{module_name}.post_process")
+    post_process = _load_post_process(plugin)
 
     global_resultier = post_process.IntegratedGlobalResultier(
         optimized_plugin_system_model
@@ -0,0 +1,216 @@
+# tests/test_cli.py
+"""Test tessif's command line interface helpers."""
+import os
+import pickle  # nosec
+import sys
+import tempfile
+
+import click
+import pytest
+from click.testing import CliRunner
+from tessif_examples import basic
+
+import tessif.cli.commands
+from tessif.cli import main_cli_entry
+from tessif.cli.commands import tropp as tropp_command
+from tessif.system_model import AbstractEnergySystem
+
+
+@pytest.fixture
+def tsf_location(tmp_path):
+    """Serialize the minimum working example into a tropp directory."""
+    location = tmp_path / "tessif_system_model.tsf"
+    location.write_text(basic.create_mwe().serialize())
+    return location
+
+
+def _forbid_deserialization(monkeypatch):
+    """Make deserializing the system model source fail."""
+
+    def deserialize(stream):
+        raise AssertionError("system model was deserialized")
+
+    monkeypatch.setattr(AbstractEnergySystem, "deserialize", deserialize)
+
+
+def test_system_model_cache_is_reused(tsf_location, monkeypatch):
+    """Test the pickled system model is used instead of the json source."""
+    system_model = tropp_command._load_system_model(tsf_location)
+    assert tsf_location.with_name(f"{tsf_location.name}.cache.pkl").is_file()
+
+    _forbid_deserialization(monkeypatch)
+    cached_system_model = tropp_command._load_system_model(tsf_location)
+
+    assert cached_system_model.uid == system_model.uid
+    assert [str(node.uid) for node in cached_system_model.nodes] == [
+        str(node.uid) for node in system_model.nodes
+    ]
+
+
+@pytest.mark.parametrize(
+    "cache_content",
+    [
+        b"",  # empty
+        b"\x80\x05corrupt",  # truncated
+        b"definitely not a pickle",
+    ],
+)
+def test_unreadable_cache_falls_back_to_source(tsf_location, cache_content):
+    """Test unreadable caches are ignored and replaced."""
+    cache_location = tsf_location.with_name(f"{tsf_location.name}.cache.pkl")
+    cache_location.write_bytes(cache_content)
+
+    system_model = tropp_command._load_system_model(tsf_location)
+
+    assert system_model.uid == basic.create_mwe().uid
+    with open(cache_location, "rb") as f:
+        key = pickle.load(f)  # nosec
+    assert key == tropp_command._system_model_cache_key(tsf_location)
+
+
+def test_cache_of_other_versions_is_ignored(tsf_location):
+    """Test caches written by other tessif or pandas versions are ignored."""
+    cache_location = tsf_location.with_name(f"{tsf_location.name}.cache.pkl")
+    key = tropp_command._system_model_cache_key(tsf_location)
+    outdated_key = (*key[:2], "0.0.0", key[3])
+    with open(cache_location, "wb") as f:
+        pickle.dump(outdated_key, f)
+        pickle.dump("outdated system model", f)
+
+    system_model = tropp_command._load_system_model(tsf_location)
+
+    assert isinstance(system_model, AbstractEnergySystem)
+
+
+@pytest.mark.parametrize(
+    "system_model",
+    [lambda: None, "picklable, but the disk is full"],
+    ids=["unpicklable", "full_disk"],
+)
+def test_failing_cache_write_is_ignored(tmp_path, monkeypatch, system_model):
+    """Test failing to write the cache leaves neither cache nor temp files."""
+
+    def replace(source, destination):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(tropp_command.os, "replace", replace)
+    cache_location = tmp_path / "tessif_system_model.tsf.cache.pkl"
+
+    tropp_command._write_cached_system_model(cache_location, "key", system_model)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_disabled_cache_is_not_written(tsf_location):
+    """Test no cache is written if caching is disabled."""
+    tropp_command._load_system_model(tsf_location, cache=False)
+
+    assert list(tsf_location.parent.iterdir()) == [tsf_location]
+
+
+def test_temporary_directories_are_recognized(tmp_path):
+    """Test directories inside the system's temporary directory are found."""
+    assert tropp_command._is_temporary_directory(tmp_path)
+    assert not tropp_command._is_temporary_directory(tempfile.gettempdir())
+
+
+def test_cli_help_lists_the_lazy_commands():
+    """Test all commands are listed in the cli help."""
+    result = CliRunner().invoke(main_cli_entry, ["--help"])
+
+    assert result.exit_code == 0
+    for command in ("init", "integrate", "tropp"):
+        assert command in result.output
+
+
+def test_cli_imports_only_the_invoked_command(monkeypatch):
+    """Test listing and invoking a command leaves the others unimported."""
+    # forget the imported commands, they are restored after the test
+    for command in ("init", "integrate"):
+        monkeypatch.delitem(sys.modules, f"tessif.cli.commands.{command}", False)
+        monkeypatch.delattr(tessif.cli.commands, command, False)
+
+    with click.Context(main_cli_entry) as ctx:
+        assert main_cli_entry.list_commands(ctx) == ["init", "integrate", "tropp"]
+    result = CliRunner().invoke(main_cli_entry, ["integrate", "--help"])
+
+    assert result.exit_code == 0
+    assert "tessif.cli.commands.integrate" in sys.modules
+    assert "tessif.cli.commands.init" not in sys.modules
+
+
+@pytest.mark.parametrize("command", ["init", "integrate", "tropp"])
+def test_cli_imports_requested_commands(command):
+    """Test each lazy command resolves to the cli of its module."""
+    with click.Context(main_cli_entry) as ctx:
+        cli = main_cli_entry.get_command(ctx, command)
+
+    assert cli is sys.modules[f"tessif.cli.commands.{command}"].cli
+
+
+def test_cli_unknown_command():
+    """Test invoking an unknown command fails."""
+    result = CliRunner().invoke(main_cli_entry, ["unknown"])
+
+    assert result.exit_code == 2
+    assert "No such command" in result.output
+
+
+@pytest.fixture
+def integrations(monkeypatch):
+    """Record the plugin integrations instead of creating any venvs."""
+    from tessif.cli.commands import integrate
+
+    integrated = []
+
+    def integrate_plugin(plugin, venv_dir, dry=False):
+        integrated.append((plugin, venv_dir, dry))
+
+    monkeypatch.setattr(integrate, "_integrate_plugin", integrate_plugin)
+    return integrated
+
+
+def test_integrate_multiple_plugins(integrations):
+    """Test each resolved plugin is integrated once into its own venv."""
+    from tessif.frused.paths import tessif_dir
+
+    result = CliRunner().invoke(
+        main_cli_entry, ["integrate", "--dry", "oemof", "PyPSA", "omf"]
+    )
+
+    assert result.exit_code == os.EX_OK
+    assert sorted(integrations) == [
+        (plugin, os.path.join(tessif_dir, "plugin-venvs", plugin), True)
+        for plugin in ("tessif-oemof-4-4", "tessif-pypsa-0-19-3")
+    ]
+
+
+def test_integrate_single_plugin_into_venv_dir(integrations, tmp_path):
+    """Test a single plugin is integrated into the supplied venv directory."""
+    result = CliRunner().invoke(
+        main_cli_entry, ["integrate", "--venv_dir", str(tmp_path), "fine"]
+    )
+
+    assert result.exit_code == os.EX_OK
+    assert integrations == [("tessif-fine-2-2-2", str(tmp_path), False)]
+
+
+def test_integrate_multiple_plugins_into_venv_dir(integrations, tmp_path):
+    """Test multiple plugins cannot share a supplied venv directory."""
+    result = CliRunner().invoke(
+        main_cli_entry,
+        ["integrate", "--venv_dir", str(tmp_path), "oemof", "pypsa"],
+    )
+
+    assert result.exit_code == 2
+    assert "--venv_dir" in result.output
+    assert not integrations
+
+
+def test_integrate_unknown_plugin(integrations):
+    """Test unrecognized plugins are refused before integrating any."""
+    result = CliRunner().invoke(main_cli_entry, ["integrate", "oemof", "unknown"])
+
+    assert result.exit_code == 2
+    assert "Plugin unknown not recognized." in result.output
+    assert not integrations
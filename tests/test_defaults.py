@@ -0,0 +1,48 @@
+# tests/test_defaults.py
+"""Test tessif's default values and registrations."""
+import pytest
+
+from tessif.frused import defaults
+
+plugins = [
+    "tessif-oemof-4-4",
+    "tessif-pypsa-0-19-3",
+    "tessif-fine-2-2-2",
+    "tessif-calliope-0-6-6post1",
+]
+
+
+@pytest.mark.parametrize("plugin", plugins)
+def test_registered_plugins_resolve_to_themselves(plugin):
+    """Test the canonical plugin names are registered."""
+    assert defaults.registered_plugins[plugin] == plugin
+    assert defaults.resolve_plugin(plugin) == plugin
+
+
+def test_registered_plugins_are_lower_cased():
+    """Test all registered spellings are stored lower cased."""
+    assert all(alias == alias.lower() for alias in defaults.registered_plugins)
+
+
+@pytest.mark.parametrize(
+    ("name", "plugin"),
+    [
+        ("oemof", "tessif-oemof-4-4"),
+        ("omf", "tessif-oemof-4-4"),
+        ("oemof-4.4", "tessif-oemof-4-4"),
+        ("PyPSA", "tessif-pypsa-0-19-3"),
+        ("ppsa", "tessif-pypsa-0-19-3"),
+        ("FINE-latest", "tessif-fine-2-2-2"),
+        (" Calliope ", "tessif-calliope-0-6-6post1"),
+        ("TESSIF-CALLIOPE-0-6-6POST1", "tessif-calliope-0-6-6post1"),
+    ],
+)
+def test_resolve_plugin_aliases(name, plugin):
+    """Test aliases resolve regardless of case and surrounding whitespace."""
+    assert defaults.resolve_plugin(name) == plugin
+
+
+@pytest.mark.parametrize("name", ["", "oemof-3", "tessif", "pypsa 0.19.3"])
+def test_resolve_unknown_plugin(name):
+    """Test unrecognized plugin names resolve to None."""
+    assert defaults.resolve_plugin(name) is None
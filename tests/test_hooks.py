@@ -0,0 +1,96 @@
+# tests/test_hooks.py
+"""Test tessif's pre simulation hooks."""
+import pandas as pd
+import pytest
+
+from tessif.hooks import ppsa
+
+# columns of the pypsa component attribute dataframes
+ATTRIBUTE_COLUMNS = ["type", "unit", "default", "description", "status"]
+
+
+def _attributes(*names):
+    """Create a pypsa like component attribute dataframe."""
+    return pd.DataFrame(
+        [("static", "MW", 0.0, name, "Input (optional)") for name in names],
+        index=list(names),
+        columns=ATTRIBUTE_COLUMNS,
+    )
+
+
+@pytest.fixture
+def attribute_dict():
+    """Create pypsa like attributes of the components extended by the hooks."""
+    return {
+        "Generator": _attributes("p_nom", "marginal_cost"),
+        "Link": _attributes("bus0", "bus1", "efficiency"),
+        "StorageUnit": _attributes("p_nom", "max_hours"),
+    }
+
+
+def test_extend_attributes_appends_rows():
+    """Test new rows are appended in order, keeping the existing ones."""
+    attributes = _attributes("bus0", "bus1")
+    extended = ppsa._extend_attributes(
+        attributes,
+        {
+            "flow_costs": ppsa._FLOW_COSTS_ROW,
+            "expansion_costs": ppsa._EXPANSION_COSTS_ROW,
+        },
+    )
+
+    assert list(extended.index) == ["bus0", "bus1", "flow_costs", "expansion_costs"]
+    assert list(extended.columns) == ATTRIBUTE_COLUMNS
+    assert tuple(extended.loc["flow_costs"]) == ppsa._FLOW_COSTS_ROW
+    pd.testing.assert_frame_equal(extended.loc[["bus0", "bus1"]], attributes)
+
+
+def test_extend_attributes_overwrites_existing_rows():
+    """Test existing rows are replaced instead of duplicated."""
+    attributes = _attributes("bus0", "flow_costs")
+    extended = ppsa._extend_attributes(attributes, {"flow_costs": ppsa._FLOW_COSTS_ROW})
+
+    assert list(extended.index) == ["bus0", "flow_costs"]
+    assert tuple(extended.loc["flow_costs"]) == ppsa._FLOW_COSTS_ROW
+
+
+def test_add_flow_bound_emissions(attribute_dict):
+    """Test flow emissions are added to generators, links and storages."""
+    extended = ppsa.add_flow_bound_emissions(attribute_dict)
+
+    for component in ("Generator", "Link", "StorageUnit"):
+        assert tuple(extended[component].loc["flow_emissions"]) == (
+            ppsa._FLOW_EMISSIONS_ROW
+        )
+
+
+def test_add_siso_transformer_type(attribute_dict):
+    """Test the siso transformer rows and expansion costs extend the links."""
+    extended = ppsa.add_siso_transfromer_type(attribute_dict)
+    link = extended["Link"]
+
+    assert list(link.index) == [
+        "bus0",
+        "bus1",
+        "efficiency",
+        "siso_transformer",
+        "flow_costs",
+        "expansion_costs",
+    ]
+    assert tuple(link.loc["flow_costs"]) == ppsa._FLOW_COSTS_ROW
+    assert tuple(link.loc["expansion_costs"]) == ppsa._EXPANSION_COSTS_ROW
+    assert "expansion_costs" not in extended["Generator"].index
+
+
+def test_chained_hooks_do_not_duplicate_rows(attribute_dict):
+    """Test chaining hooks adding the same rows keeps them unique."""
+    extended = ppsa.extend_number_of_link_interfaces(
+        ppsa.add_siso_transfromer_type(ppsa.add_flow_bound_emissions(attribute_dict)),
+        additional_interfaces=2,
+    )
+    link = extended["Link"]
+
+    assert link.index.is_unique
+    for name in ("bus", "efficiency", "flow_costs", "p_nom", "p"):
+        assert f"{name}2" in link.index
+        assert f"{name}3" in link.index
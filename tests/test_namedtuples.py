@@ -0,0 +1,102 @@
+# tests/test_namedtuples.py
+"""Test tessif's uid namedtuples."""
+import pytest
+
+import tessif.frused.configurations as config
+from tessif.frused.namedtuples import Uid
+
+
+@pytest.fixture
+def uid_style(monkeypatch):
+    """Select a node uid style, restoring the configured one afterwards."""
+
+    def select(style, seperator="_"):
+        monkeypatch.setattr(config, "node_uid_style", style)
+        monkeypatch.setattr(config, "node_uid_seperator", seperator)
+
+    return select
+
+
+def test_equal_uids_stringify_by_their_own_values(uid_style):
+    """Test equal uids of different value types stringify independently."""
+    uid_style("coords")
+
+    assert str(Uid("x", 1, 2)) == "x_1_2"
+    assert str(Uid("x", 1.0, 2.0)) == "x_1.0_2.0"
+    assert str(Uid("x", 1, 2)) == "x_1_2"
+
+
+def test_uid_string_follows_the_configuration(uid_style):
+    """Test uid strings respect the currently configured style."""
+    uid = Uid("x", region="hamburg", sector="power")
+
+    uid_style("name")
+    assert str(uid) == "x"
+
+    uid_style("region", seperator="-")
+    assert str(uid) == "x-hamburg"
+
+    uid_style("qualname")
+    assert str(uid) == "x_None_None_hamburg_power_None_None_None"
+
+
+@pytest.mark.parametrize(
+    ("style", "expected"),
+    [
+        ("name", Uid("x")),
+        ("qualname", Uid("x", "1", "2", "r", "s", "c", "comp", "nt")),
+        ("coords", Uid("x", "1", "2")),
+        ("region", Uid("x", region="1")),
+        ("sector", Uid("x", sector="1")),
+        ("carrier", Uid("x", carrier="1")),
+        ("component", Uid("x", component="1")),
+        ("node_type", Uid("x", node_type="1")),
+    ],
+)
+def test_reconstruct_drops_surplus_parts(uid_style, style, expected):
+    """Test reconstruction only uses the leading parts the style needs."""
+    uid_style(style)
+
+    assert Uid.reconstruct("x_1_2_r_s_c_comp_nt") == expected
+
+
+def test_reconstruct_needs_all_style_fields(uid_style):
+    """Test reconstructing a too short string representation fails."""
+    uid_style("coords")
+
+    with pytest.raises(IndexError):
+        Uid.reconstruct("x_1")
+
+
+def test_from_row_pads_missing_fields():
+    """Test rows shorter than the uid fields are padded with None."""
+    assert Uid.from_row(["x", 1, 2, "hamburg"]) == Uid("x", 1, 2, "hamburg")
+    assert Uid.from_row(("x",)) == Uid("x")
+
+
+def test_from_row_equals_keyword_construction():
+    """Test full rows create the same uid the keyword construction does."""
+    row = ("x", 1, 2, "hamburg", "power", "electricity", "bus", "AC")
+    fields = dict(zip(Uid._fields, row))
+
+    assert Uid.from_row(row) == Uid(**fields)
+
+
+def test_from_row_rejects_over_long_rows():
+    """Test rows longer than the uid fields are refused."""
+    with pytest.raises(TypeError):
+        Uid.from_row(["x", 1, 2, "r", "s", "c", "comp", "nt", "surplus"])
+
+
+def test_from_row_interns_categorizations():
+    """Test equal categorization strings share a single object."""
+    # strings created at runtime, so they are not interned already
+    region = "".join(["ham", "burg"])
+    other_region = "".join(["ham", "burg"])
+    assert region is not other_region
+
+    uid = Uid.from_row(["x", 1, 2, region])
+    other_uid = Uid.from_row(["y", 1, 2, other_region])
+
+    assert uid.region is other_uid.region
+    assert uid.region is Uid("z", region="hamburg").region
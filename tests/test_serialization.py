@@ -1,8 +1,12 @@
 """Test tessifs serialization capabilities."""
+import json
 
+import pandas as pd
 import pytest
 from tessif_examples import basic, scientific
 
+from tessif.deserialize import RestoredResults, load_tropp_json
+from tessif.serialize import ResultierEncoder
 from tessif.system_model import AbstractEnergySystem as Aes  # nopep8
 
 basic_creates = [attr for attr in dir(basic) if "create" in attr]
@@ -59,3 +63,79 @@ def test_scientific_es_serialization(system_model_name):
                     es_node.attributes.values(), pes_node.attributes.values()
                 ):
                     assert es_attr == pes_attr
+
+
+@pytest.mark.parametrize("times_encoded", [1, 2])
+def test_tropp_file_round_trip(times_encoded):
+    """Test once and (legacy) twice encoded system models are restored."""
+    es = basic.create_mwe()
+    stream = es.serialize()
+    for _ in range(times_encoded - 1):
+        stream = json.dumps(stream)
+
+    parsed_es = Aes.deserialize(stream)
+
+    assert parsed_es.uid == es.uid
+    assert parsed_es.timeframe.equals(es.timeframe)
+    assert [str(node.uid) for node in parsed_es.nodes] == [
+        str(node.uid) for node in es.nodes
+    ]
+
+
+def test_load_tropp_json_reads_both_encodings():
+    """Test tropp results load the same, no matter how often encoded."""
+    results = {"_nodes": ["a", "b"], "_number_of_constraints": 42}
+    once_encoded = json.dumps(results)
+    twice_encoded = json.dumps(once_encoded)
+
+    assert load_tropp_json(once_encoded) == results
+    assert load_tropp_json(twice_encoded) == results
+
+
+@pytest.mark.parametrize(
+    "index",
+    [basic.create_mwe().timeframe, pd.RangeIndex(24)],
+    ids=["datetime_index", "numeric_index"],
+)
+def test_restored_results_equal_read_json(index):
+    """Test restored series and frames equal the ones read by pandas."""
+    integral = [float(step) for step in range(len(index))]
+    fractional = [step / 4 for step in range(len(index))]
+    results = {
+        "_states_of_charge": {
+            "Battery": pd.Series(fractional, index=index, name="Battery"),
+        },
+        "_node_loads": {
+            "Power Line": pd.DataFrame(
+                {"Gas Station": integral, "Battery": fractional}, index=index
+            ),
+        },
+    }
+    serialized = json.loads(json.dumps(results, cls=ResultierEncoder))
+    restored = RestoredResults(serialized)
+
+    pd.testing.assert_series_equal(
+        restored.states_of_charge["Battery"],
+        pd.read_json(
+            serialized["_states_of_charge"]["Battery"], orient="split", typ="series"
+        ),
+    )
+    pd.testing.assert_frame_equal(
+        restored.node_loads["Power Line"],
+        pd.read_json(
+            serialized["_node_loads"]["Power Line"], orient="split", typ="frame"
+        ),
+    )
+
+
+def test_restored_bounds_are_not_shared():
+    """Test altering returned in- and outbounds leaves the results unchanged."""
+    restored = RestoredResults(
+        {"_nodes": ["1", "2", "3"], "_edges": [["1", "2"], ["3", "2"]]}
+    )
+
+    restored.inbounds["2"] = ()
+    restored.outbounds.clear()
+
+    assert restored.inbounds == {"1": (), "2": ("1", "3"), "3": ()}
+    assert restored.outbounds == {"1": ("2",), "2": (), "3": ("2",)}
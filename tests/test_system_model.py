@@ -0,0 +1,69 @@
+# tests/test_system_model.py
+"""Test tessif's abstract energy system."""
+import pytest
+from tessif_examples import basic
+
+
+@pytest.fixture
+def mwe():
+    """Create the minimum working example system model."""
+    return basic.create_mwe()
+
+
+def _recreate(node, **parameters):
+    """Recreate node using the same uid and changed parameters."""
+    attributes = {**node.attributes, **parameters}
+    attributes.pop("uid")
+    return type(node)(**node.uid._asdict(), **attributes)
+
+
+def test_replace_nodes_swaps_the_requested_nodes(mwe):
+    """Test the replacing node takes the replaced node's place."""
+    demand = next(mwe.sinks)
+    replacement = _recreate(demand, flow_rates={"electricity": (11, 11)})
+
+    replaced_es = mwe.replace_nodes({str(demand.uid): replacement})
+
+    assert list(replaced_es.sinks) == [replacement]
+    assert [str(node.uid) for node in replaced_es.nodes] == [
+        str(node.uid) for node in mwe.nodes
+    ]
+
+
+def test_replace_nodes_shares_the_other_nodes(mwe):
+    """Test all nodes not requested are shared with the original system."""
+    demand = next(mwe.sinks)
+    replaced_es = mwe.replace_nodes({str(demand.uid): _recreate(demand)})
+
+    for node, replaced_node in zip(mwe.nodes, replaced_es.nodes):
+        if node is not demand:
+            assert replaced_node is node
+
+    assert replaced_es.timeframe is mwe.timeframe
+    assert sorted(replaced_es.edges) == sorted(mwe.edges)
+
+
+def test_replace_nodes_leaves_the_original_unchanged(mwe):
+    """Test the replaced system model is a copy."""
+    nodes = list(mwe.nodes)
+    demand = next(mwe.sinks)
+
+    replaced_es = mwe.replace_nodes({str(demand.uid): _recreate(demand)})
+
+    assert replaced_es is not mwe
+    assert list(mwe.nodes) == nodes
+    assert next(mwe.sinks) is demand
+
+
+def test_replace_nodes_uid(mwe):
+    """Test the copy keeps the system's uid, unless a new one is given."""
+    assert mwe.replace_nodes({}).uid == mwe.uid
+    assert mwe.replace_nodes({}, uid="Replaced MWE").uid == "Replaced MWE"
+
+
+def test_replace_nodes_ignores_unknown_uids(mwe):
+    """Test replacements not matching any node are not added."""
+    demand = next(mwe.sinks)
+    replaced_es = mwe.replace_nodes({"Unknown": _recreate(demand)})
+
+    assert list(replaced_es.nodes) == list(mwe.nodes)